@@ -15,7 +15,7 @@ pytestmark = pytest.mark.integration
 
 
 def _write_dat_index(index_path: Path, entries: list[tuple[bytes, str]]) -> None:
-    from src.core.dat_index_sqlite import DatIndexSqlite
+    from src.core.dat_index_sqlite import DatHashRow, DatIndexSqlite
 
     index = DatIndexSqlite(index_path)
     cur = index.conn.cursor()
@@ -23,15 +23,13 @@ def _write_dat_index(index_path: Path, entries: list[tuple[bytes, str]]) -> None
         "INSERT OR IGNORE INTO dat_files (dat_id, source_path, mtime, size_bytes, active) VALUES (1, ?, 0, 0, 1)",
         ("test.dat",),
     )
+    index.conn.commit()
+    rows = []
     for payload, platform_id in entries:
         sha1 = hashlib.sha1(payload).hexdigest()
         crc32 = f"{zlib.crc32(payload) & 0xFFFFFFFF:08x}"
-        size_bytes = len(payload)
-        cur.execute(
-            "INSERT INTO rom_hashes (dat_id, platform_id, rom_name, set_name, crc32, sha1, size_bytes) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (1, platform_id, "rom", "set", crc32, sha1, size_bytes),
-        )
-    index.conn.commit()
+        rows.append(DatHashRow(1, platform_id, "rom", "set", crc32, sha1, len(payload)))
+    index.insert_rows(rows)
     index.close()
 
 
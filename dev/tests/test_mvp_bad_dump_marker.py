@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from src.core.dat_index_sqlite import DatIndexSqlite
+from src.core.dat_index_sqlite import DatHashRow, DatIndexSqlite
 from src.detectors.dat_identifier import identify_by_hash
 from src.core.file_utils import calculate_file_hash
 
@@ -19,11 +19,8 @@ def test_identify_bad_dump_signal(tmp_path: Path) -> None:
             "INSERT INTO dat_files (source_path, mtime, size_bytes, active) VALUES (?, ?, ?, ?)",
             ("/tmp/test.dat", 1, 10, 1),
         )
-        cur.execute(
-            "INSERT INTO rom_hashes (dat_id, platform_id, rom_name, set_name, crc32, sha1, size_bytes) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (1, "NES", "Game [b].rom", "Game", "abcd", sha1, 4),
-        )
         index.conn.commit()
+        index.insert_rows([DatHashRow(1, "NES", "Game [b].rom", "Game", "abcd", sha1, 4)])
 
         result = identify_by_hash(str(rom), index)
 
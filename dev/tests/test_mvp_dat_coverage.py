@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Any, Dict, cast
 
-from src.core.dat_index_sqlite import DatIndexSqlite
+from src.core.dat_index_sqlite import DatHashRow, DatIndexSqlite
 
 
 def test_dat_coverage_report_counts_platforms(tmp_path: Path) -> None:
@@ -17,19 +17,17 @@ def test_dat_coverage_report_counts_platforms(tmp_path: Path) -> None:
             "INSERT INTO dat_files (source_path, mtime, size_bytes, active) VALUES (?, ?, ?, ?)",
             ("/tmp/b.dat", 1, 10, 0),
         )
-        cur.execute(
-            "INSERT INTO rom_hashes (dat_id, platform_id, rom_name, set_name, crc32, sha1, size_bytes) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (1, "NES", "rom1", "set1", "abc", None, 123),
-        )
-        cur.execute(
-            "INSERT INTO rom_hashes (dat_id, platform_id, rom_name, set_name, crc32, sha1, size_bytes) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (1, "SNES", "rom2", "set2", "def", None, 456),
-        )
         cur.execute(
             "INSERT INTO game_names (dat_id, platform_id, game_name) VALUES (?, ?, ?)",
             (1, "NES", "Game 1"),
         )
         index.conn.commit()
+        index.insert_rows(
+            [
+                DatHashRow(1, "NES", "rom1", "set1", "abc", None, 123),
+                DatHashRow(1, "SNES", "rom2", "set2", "def", None, 456),
+            ]
+        )
 
         report = cast(Dict[str, Any], index.coverage_report())
 
@@ -0,0 +1,115 @@
+import sys
+import threading
+from pathlib import Path
+
+# Ensure repo root on path
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _write_dat(path: Path, system_name: str, roms: list[tuple[str, str, str | None, int]]) -> None:
+    games = []
+    for name, crc, sha1, size in roms:
+        sha1_attr = f' sha1="{sha1}"' if sha1 else ""
+        games.append(f'  <game name="{name}">\n    <rom name="{name}.bin" crc="{crc}"{sha1_attr} size="{size}" />\n  </game>')
+    path.write_text(
+        '<?xml version="1.0"?>\n<datfile>\n  <header>\n    <name>'
+        + system_name
+        + "</name>\n  </header>\n"
+        + "\n".join(games)
+        + "\n</datfile>\n",
+        encoding="utf-8",
+    )
+
+
+def _build(tmp_path: Path, shard_count: int = 0):
+    from src.core.dat_index_sqlite import build_index_from_config, open_dat_index_from_config
+
+    dat_dir = tmp_path / "dats"
+    dat_dir.mkdir()
+    _write_dat(
+        dat_dir / "nes.dat",
+        "Nintendo - Nintendo Entertainment System",
+        [(f"Game {i}", f"{i:08x}", f"{i:040x}", 100 + i) for i in range(40)],
+    )
+    _write_dat(
+        dat_dir / "snes.dat",
+        "Super Nintendo Entertainment System",
+        [("NoSha", "deadbeef", None, 512)],
+    )
+    dats = {
+        "import_paths": [str(dat_dir)],
+        "index_path": str(tmp_path / "index.sqlite"),
+        "lock_path": str(tmp_path / "index.lock"),
+    }
+    if shard_count:
+        dats["sharding"] = {"enabled": True, "shard_count": shard_count}
+    cfg = {"dats": dats}
+    build_index_from_config(config=cfg)
+    return open_dat_index_from_config(cfg)
+
+
+def test_batched_lookups_match_single_lookups(tmp_path: Path) -> None:
+    index = _build(tmp_path)
+    try:
+        sha1s = [f"{i:040x}".upper() for i in range(0, 40, 3)] + ["f" * 40]
+        many = index.lookup_sha1_many(sha1s)
+        assert set(many) == {s.lower() for s in sha1s[:-1]}
+        for sha1 in sha1s[:-1]:
+            assert many[sha1.lower()] == index.lookup_sha1(sha1)
+
+        pairs = [("DEADBEEF", 512), ("deadbeef", 1), (f"{5:08x}", 105)]
+        crc_hits = index.lookup_crc_size_many(pairs)
+        assert set(crc_hits) == {("deadbeef", 512), (f"{5:08x}", 105)}
+        missing = index.lookup_crc_size_when_sha1_missing_many(pairs)
+        assert set(missing) == {("deadbeef", 512)}
+        assert missing[("deadbeef", 512)].rom_name == "NoSha.bin"
+    finally:
+        index.close()
+
+
+def test_reads_run_on_pooled_connections_from_many_threads(tmp_path: Path) -> None:
+    index = _build(tmp_path)
+    errors: list[BaseException] = []
+
+    def worker(offset: int) -> None:
+        try:
+            for i in range(offset, 40, 8):
+                row = index.lookup_sha1(f"{i:040x}")
+                assert row is not None and row.rom_name == f"Game {i}.bin"
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert not errors
+    assert index._readers, "read-only connections should be pooled"
+    index.close()
+    assert index._readers == []
+
+
+def test_sharded_fan_out_and_scanner_batcher(tmp_path: Path) -> None:
+    from src.scanning.dat_lookup import DatLookupBatcher
+
+    index = _build(tmp_path, shard_count=2)
+    try:
+        assert index.lookup_sha1(f"{7:040x}").platform_id == "NES"
+        assert len(index.lookup_sha1_many([f"{i:040x}" for i in range(40)])) == 40
+
+        batcher = DatLookupBatcher(index, batch_size=8)
+        futures = [batcher.submit(f"{i:040x}", f"{i:08x}", 100 + i) for i in range(20)]
+        futures.append(batcher.submit("0" * 39 + "z", "deadbeef", 512))
+        results = [future.result(timeout=10) for future in futures]
+        batcher.close()
+
+        assert all(result and result[1] == "dat:sha1" for result in results[:20])
+        assert results[-1][1] == "dat:crc-size"
+        assert batcher.lookups == 21
+        assert batcher.batches <= batcher.lookups
+    finally:
+        index.close()
@@ -0,0 +1,115 @@
+import sys
+from pathlib import Path
+
+# Ensure repo root on path
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _write_dat(path: Path, system_name: str, start: int, count: int) -> None:
+    games = []
+    for i in range(start, start + count):
+        sha1_attr = f' sha1="{i:040x}"' if i % 5 else ""
+        games.append(
+            f'  <game name="Game {i}">\n    <rom name="game{i}.bin" crc="{i:08x}"{sha1_attr} size="{100 + i}" />\n  </game>'
+        )
+    path.write_text(
+        '<?xml version="1.0"?>\n<datfile>\n  <header>\n    <name>'
+        + system_name
+        + "</name>\n  </header>\n"
+        + "\n".join(games)
+        + "\n</datfile>\n",
+        encoding="utf-8",
+    )
+
+
+def _dat_dir(tmp_path: Path) -> Path:
+    dat_dir = tmp_path / "dats"
+    dat_dir.mkdir()
+    _write_dat(dat_dir / "nes.dat", "Nintendo - Nintendo Entertainment System", 0, 30)
+    _write_dat(dat_dir / "gb.dat", "Nintendo - Game Boy", 30, 20)
+    _write_dat(dat_dir / "md.dat", "Sega - Mega Drive - Genesis", 50, 10)
+    return dat_dir
+
+
+def _index_names(index) -> set:
+    rows = index.conn.execute("SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'").fetchall()
+    return {row[0] for row in rows}
+
+
+def test_bulk_ingest_matches_sequential_ingest(tmp_path: Path) -> None:
+    from src.core.dat_index_sqlite import DatIndexSqlite
+
+    dat_dir = _dat_dir(tmp_path)
+    sequential = DatIndexSqlite(tmp_path / "seq.sqlite")
+    bulk = DatIndexSqlite(tmp_path / "bulk.sqlite")
+    try:
+        expected_indexes = _index_names(bulk)
+        seq_result = sequential.ingest([str(dat_dir)])
+        bulk_result = bulk.ingest([str(dat_dir)], bulk=True, workers=2)
+
+        assert bulk_result["processed"] == seq_result["processed"] == 3
+        assert bulk_result["inserted"] == seq_result["inserted"] == 60
+        assert set(bulk_result["timings"]) >= {"collect", "parse", "insert", "index", "total"}
+        assert bulk.coverage_report() == sequential.coverage_report()
+        # Secondary indexes dropped for the full rebuild are back.
+        assert _index_names(bulk) == expected_indexes
+
+        for i in range(60):
+            if i % 5:
+                assert bulk.lookup_sha1(f"{i:040x}") == sequential.lookup_sha1(f"{i:040x}")
+            else:
+                row = bulk.lookup_crc_size_when_sha1_missing(f"{i:08x}", 100 + i)
+                assert row == sequential.lookup_crc_size_when_sha1_missing(f"{i:08x}", 100 + i)
+                assert row is not None
+    finally:
+        sequential.close()
+        bulk.close()
+
+
+def test_bulk_ingest_is_incremental(tmp_path: Path) -> None:
+    from src.core.dat_index_sqlite import DatIndexSqlite
+
+    dat_dir = _dat_dir(tmp_path)
+    index = DatIndexSqlite(tmp_path / "index.sqlite")
+    try:
+        index.ingest([str(dat_dir)], bulk=True, workers=1)
+        again = index.ingest([str(dat_dir)], bulk=True, workers=1)
+        assert (again["processed"], again["skipped"]) == (0, 3)
+
+        _write_dat(dat_dir / "gb.dat", "Nintendo - Game Boy", 200, 4)
+        (dat_dir / "md.dat").unlink()
+        update = index.ingest([str(dat_dir)], bulk=True, workers=1)
+        assert (update["processed"], update["skipped"], update["removed"]) == (1, 1, 1)
+
+        assert index.lookup_sha1(f"{31:040x}") is None
+        assert index.lookup_sha1(f"{201:040x}").rom_name == "game201.bin"
+        assert index.lookup_sha1(f"{51:040x}") is None
+        assert index.lookup_sha1(f"{1:040x}") is not None
+        assert index.coverage_report()["rom_hashes"] == 34
+    finally:
+        index.close()
+
+
+def test_sharded_build_ingests_shards_concurrently(tmp_path: Path) -> None:
+    from src.core.dat_index_sqlite import build_index_from_config, open_dat_index_from_config
+
+    dat_dir = _dat_dir(tmp_path)
+    cfg = {
+        "dats": {
+            "import_paths": [str(dat_dir)],
+            "index_path": str(tmp_path / "index.sqlite"),
+            "lock_path": str(tmp_path / "index.lock"),
+            "ingest_workers": 2,
+            "sharding": {"enabled": True, "shard_count": 2},
+        }
+    }
+    result = build_index_from_config(config=cfg)
+    assert result["processed"] == 3 and result["inserted"] == 60 and result["shards"] == 2
+
+    index = open_dat_index_from_config(cfg)
+    try:
+        assert len(index.lookup_sha1_many([f"{i:040x}" for i in range(60) if i % 5])) == 48
+    finally:
+        index.close()
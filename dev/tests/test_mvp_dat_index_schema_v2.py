@@ -0,0 +1,93 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+# Ensure repo root on path
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _create_v1_index(path: Path) -> None:
+    conn = sqlite3.connect(str(path))
+    cur = conn.cursor()
+    cur.execute(
+        "CREATE TABLE dat_files (dat_id INTEGER PRIMARY KEY AUTOINCREMENT, source_path TEXT UNIQUE NOT NULL, "
+        "mtime INTEGER, size_bytes INTEGER, content_hash TEXT, active INTEGER DEFAULT 1)"
+    )
+    cur.execute(
+        "CREATE TABLE rom_hashes (dat_id INTEGER NOT NULL, platform_id TEXT, rom_name TEXT, set_name TEXT, "
+        "crc32 TEXT, sha1 TEXT, size_bytes INTEGER)"
+    )
+    cur.execute("CREATE UNIQUE INDEX idx_rom_hashes_sha1 ON rom_hashes(sha1) WHERE sha1 IS NOT NULL")
+    cur.execute("CREATE TABLE game_names (dat_id INTEGER NOT NULL, platform_id TEXT, game_name TEXT)")
+    cur.execute("INSERT INTO dat_files (source_path, mtime, size_bytes, active) VALUES ('/dats/nes.dat', 1, 1, 1)")
+    cur.executemany(
+        "INSERT INTO rom_hashes VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (1, "NES", "a.nes", "A", "0000abcd", "ab" * 20, 16),
+            (1, "NES", "b.nes", "B", "1234abcd", None, 32),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_v1_text_index_is_migrated_in_place(tmp_path: Path) -> None:
+    from src.core.dat_index_sqlite import SCHEMA_VERSION, DatIndexSqlite
+
+    index_path = tmp_path / "index.sqlite"
+    _create_v1_index(index_path)
+
+    index = DatIndexSqlite(index_path)
+    try:
+        assert int(index.conn.execute("PRAGMA user_version").fetchone()[0]) == SCHEMA_VERSION
+        kind = index.conn.execute("SELECT type FROM sqlite_master WHERE name='rom_hashes'").fetchone()[0]
+        assert kind == "view"
+
+        row = index.lookup_sha1("AB" * 20)
+        assert row is not None
+        assert (row.rom_name, row.crc32, row.sha1, row.size_bytes) == ("a.nes", "0000abcd", "ab" * 20, 16)
+
+        # Short legacy CRC strings match their zero-padded form now.
+        assert index.lookup_crc_size_when_sha1_missing("1234ABCD", 32).rom_name == "b.nes"
+        # A SHA1-bearing entry with the same CRC32+size blocks the CRC fallback.
+        assert index.lookup_crc_size_when_sha1_missing("abcd", 16) is None
+        assert index.coverage_report()["rom_hashes"] == 2
+    finally:
+        index.close()
+
+    # Re-opening a migrated file is a no-op.
+    again = DatIndexSqlite(index_path)
+    assert again.lookup_sha1("ab" * 20) is not None
+    again.close()
+
+
+def test_binary_columns_and_md5_from_dat(tmp_path: Path) -> None:
+    from src.core.dat_index_sqlite import DatIndexSqlite
+
+    dat = tmp_path / "sample.dat"
+    dat.write_text(
+        '<?xml version="1.0"?>\n<datfile><header><name>Nintendo - Nintendo Entertainment System</name></header>'
+        '<game name="Game"><rom name="game.nes" size="8" crc="0a0b0c0d" md5="' + "cd" * 16 + '" sha1="' + "ef" * 20 + '"/></game>'
+        "</datfile>\n",
+        encoding="utf-8",
+    )
+    index = DatIndexSqlite(tmp_path / "index.sqlite")
+    try:
+        index.ingest([str(dat)])
+        sha1, crc32, md5 = index.conn.execute("SELECT sha1, crc32, md5 FROM rom_hashes_sha1").fetchone()
+        assert sha1 == bytes.fromhex("ef" * 20)
+        assert crc32 == 0x0A0B0C0D
+        assert md5 == bytes.fromhex("cd" * 16)
+
+        row = index.lookup_sha1("ef" * 20)
+        assert row is not None and row.md5 == "cd" * 16 and row.crc32 == "0a0b0c0d"
+        assert index.lookup_crc_size("0a0b0c0d", 8) == row
+
+        plan = " ".join(
+            str(r[-1]) for r in index.conn.execute("EXPLAIN QUERY PLAN SELECT * FROM rom_hashes_sha1 WHERE sha1=?", (b"x",))
+        )
+        assert "PRIMARY KEY" in plan
+    finally:
+        index.close()
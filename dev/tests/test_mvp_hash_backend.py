@@ -0,0 +1,63 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Ensure repo root on path
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def test_hash_backend_config_defaults_to_thread() -> None:
+    from src.scanning.hash_backend import resolve_hash_backend
+
+    assert resolve_hash_backend({}) == "thread"
+    assert resolve_hash_backend({"scanner": {"hash_backend": "PROCESS"}}) == "process"
+    assert resolve_hash_backend({"scanner": {"hash_backend": "gpu"}}) == "thread"
+
+
+def test_process_backend_matches_thread_hashes(tmp_path: Path) -> None:
+    from src.scanning.hash_backend import ProcessHashBackend
+    from src.scanning.high_performance_scanner import HighPerformanceScanner
+
+    files = []
+    for idx in range(5):
+        path = tmp_path / f"rom_{idx}.bin"
+        path.write_bytes(bytes([idx]) * (70_000 + idx))
+        files.append(str(path))
+
+    scanner = HighPerformanceScanner({})
+    expected = [scanner._calculate_checksums(path) for path in files]
+
+    backend = ProcessHashBackend(64 * 1024, workers=1, batch_size=2, with_md5=scanner.hash_plan.md5)
+    try:
+        futures = [backend.submit(path) for path in files]
+        from src.scanning.hash_backend import format_hash_tuple
+
+        assert [format_hash_tuple(f.result(timeout=30)) for f in futures] == expected
+        with pytest.raises(OSError):
+            backend.hash_file(str(tmp_path / "missing.bin"))
+        backend.stop()
+        with pytest.raises(InterruptedError):
+            backend.hash_file(files[0])
+    finally:
+        backend.close()
+
+
+def test_scan_with_process_backend(tmp_path: Path) -> None:
+    from src.scanning.high_performance_scanner import HighPerformanceScanner
+
+    (tmp_path / "game.nes").write_bytes(b"NES\x1a" + b"\x01" * 128)
+    scanner = HighPerformanceScanner({"scanner": {"hash_backend": "process", "hash_processes": 1}})
+    found: list[dict] = []
+    done = threading.Event()
+    scanner.on_rom_found = found.append
+    scanner.on_complete = lambda _stats: done.set()
+
+    assert scanner.scan(str(tmp_path), use_cache=False)
+    assert done.wait(timeout=60)
+    assert len(found) == 1
+    assert found[0]["sha1"] and len(found[0]["sha1"]) == 40
+    assert scanner._hash_backend is None
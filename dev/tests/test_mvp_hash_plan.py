@@ -0,0 +1,33 @@
+import hashlib
+import sys
+from pathlib import Path
+
+# Ensure repo root on path
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def test_hash_plan_auto_skips_md5() -> None:
+    from src.scanning.hash_plan import resolve_hash_plan
+
+    plan = resolve_hash_plan({})
+    assert plan.names == ("crc32", "sha1")
+    assert resolve_hash_plan({"scanner": {"hash_set": "full"}}).names == ("crc32", "md5", "sha1")
+    assert resolve_hash_plan({"scanner": {"hash_set": ["md5"]}}).md5 is True
+    assert resolve_hash_plan({"scanner": {"hash_set": "bogus"}}).names == ("crc32", "sha1")
+
+
+def test_scanner_checksums_follow_hash_plan(tmp_path: Path) -> None:
+    from src.scanning.high_performance_scanner import HighPerformanceScanner
+
+    rom = tmp_path / "game.bin"
+    payload = b"\x12\x34" * 5000
+    rom.write_bytes(payload)
+
+    crc, md5, sha1 = HighPerformanceScanner({})._calculate_checksums(str(rom))
+    assert md5 is None
+    assert sha1 == hashlib.sha1(payload).hexdigest()
+
+    _, md5_full, _ = HighPerformanceScanner({"scanner": {"hash_set": "full"}})._calculate_checksums(str(rom))
+    assert md5_full == hashlib.md5(payload).hexdigest()
@@ -1,6 +1,5 @@
 import json
 import os
-import sqlite3
 import sys
 from pathlib import Path
 
@@ -12,7 +11,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from src.app.controller import ScanItem, add_identification_override, identify  # noqa: E402
-from src.core.dat_index_sqlite import DatIndexSqlite  # noqa: E402
+from src.core.dat_index_sqlite import DatHashRow, DatIndexSqlite  # noqa: E402
 from src.hash_utils import calculate_crc32  # noqa: E402
 from src.core.file_utils import calculate_file_hash  # noqa: E402
 
@@ -34,16 +33,11 @@ def _insert_hash_row(
     crc32: str | None,
     size_bytes: int,
 ) -> None:
-    conn = sqlite3.connect(str(index_path))
+    index = DatIndexSqlite(index_path)
     try:
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT INTO rom_hashes (dat_id, platform_id, rom_name, set_name, crc32, sha1, size_bytes) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (dat_id, platform_id, "Test ROM", "Test Set", (crc32 or "").lower(), sha1, size_bytes),
-        )
-        conn.commit()
+        index.insert_rows([DatHashRow(dat_id, platform_id, "Test ROM", "Test Set", (crc32 or "").lower(), sha1, size_bytes)])
     finally:
-        conn.close()
+        index.close()
 
 
 def test_identify_returns_unknown_when_index_missing(tmp_path):
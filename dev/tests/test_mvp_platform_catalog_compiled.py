@@ -0,0 +1,80 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure repo root on path
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.core import platform_heuristics as heuristics  # noqa: E402
+
+
+def _platform(platform_id: str, ext: str, tokens=None, negative=None, minimum=None) -> dict:
+    return {
+        "platform_id": platform_id,
+        "canonical_name": platform_id.upper(),
+        "aliases": [],
+        "category": "No-Intro",
+        "media_types": ["rom"],
+        "allowed_containers": [ext.lstrip(".")],
+        "typical_extensions": [ext],
+        "positive_tokens": tokens or [],
+        "negative_tokens": negative or [],
+        "conflict_groups": [],
+        "minimum_signals": minimum if minimum is not None else ["extension"],
+    }
+
+
+def test_token_automaton_finds_overlapping_tokens() -> None:
+    platforms = [
+        _platform("ps", ".iso", tokens=["ps", "ps2", "playstation 2"], minimum=[]),
+        _platform("gc", ".gcm", tokens=["gc", "gamecube"], negative=["wii"], minimum=[]),
+    ]
+    catalog = heuristics.CompiledPlatformCatalog(platforms, "ok", {})
+
+    found = catalog.match_tokens("roms playstation 2 ps2 gamecube wii")
+    assert {"ps", "ps2", "playstation 2", "gamecube", "wii"} <= found
+    assert "gc" not in found
+
+
+def test_compiled_catalog_respects_minimum_signals_and_negatives() -> None:
+    platforms = [
+        _platform("nes", ".nes", tokens=["nes"]),
+        _platform("famicom", ".nes", tokens=["famicom"], negative=["nes"], minimum=[]),
+    ]
+    catalog = heuristics.CompiledPlatformCatalog(platforms, "ok", {"min_top_score": 2.0})
+
+    result = catalog.evaluate("/roms/famicom/game.nes")
+    assert result["candidate_systems"] == ["nes", "famicom"]
+    details = {d["platform_id"]: d for d in result["candidate_details"]}
+    assert details["famicom"]["signals"] == ["EXT:.nes", "CONTAINER:nes", "TOKEN:famicom", "NEG:nes"]
+    assert result["policy"] == {"min_top_score": 2.0}
+
+    # Token-only hit without the required extension signal is dropped.
+    assert catalog.evaluate("/roms/nes/readme.txt")["reason"] == "no_match"
+
+
+def test_evaluate_many_matches_single_calls_and_reloads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    catalog_path = tmp_path / "catalog.yaml"
+    catalog_path.write_text(
+        json.dumps({"version": "1.0", "policy": {}, "platforms": [_platform("nes", ".nes")]}),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("ROM_SORTER_PLATFORM_CATALOG", str(catalog_path))
+    heuristics._load_catalog.cache_clear()
+
+    paths = ["a.nes", "b.sfc", "/roms/nes/c.zip"]
+    batch = heuristics.evaluate_many(paths, containers=[None, None, "zip"])
+    assert batch == [heuristics.evaluate_platform_candidates(p, container=c) for p, c in zip(paths, [None, None, "zip"])]
+    assert batch[0]["candidate_systems"] == ["nes"]
+
+    first = heuristics.get_compiled_catalog()
+    assert heuristics.get_compiled_catalog() is first
+
+    # cache_clear() must also drop the compiled form.
+    heuristics._load_catalog.cache_clear()
+    assert heuristics.get_compiled_catalog() is not first
+    heuristics._load_catalog.cache_clear()
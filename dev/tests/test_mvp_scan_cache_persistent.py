@@ -0,0 +1,88 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure repo root on path
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _make_scanner(tmp_path: Path, **cache_overrides):
+    from src.scanning.high_performance_scanner import HighPerformanceScanner
+
+    cache_cfg = {"enabled": True, "path": str(tmp_path / "scan_cache.sqlite")}
+    cache_cfg.update(cache_overrides)
+    return HighPerformanceScanner({"scanner": {"persistent_cache": cache_cfg}})
+
+
+def test_persistent_cache_survives_new_scanner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    rom = tmp_path / "game.nes"
+    rom.write_bytes(b"NES\x1a" + b"\x00" * 64)
+
+    first = _make_scanner(tmp_path)
+    info = first._process_file(str(rom))
+    assert info and info["sha1"]
+    first._persistent_cache.close()
+
+    second = _make_scanner(tmp_path)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("unchanged file must not be re-hashed")
+
+    monkeypatch.setattr(second, "_calculate_checksums", _fail)
+    cached = second._process_file(str(rom))
+    assert cached is not None
+    assert cached["sha1"] == info["sha1"]
+
+    stats = second.get_cache_stats()["persistent"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 0
+
+
+def test_persistent_cache_invalidates_on_mtime_ns_and_context(tmp_path: Path) -> None:
+    from src.scanning.scan_cache import PersistentScanCache
+
+    rom = tmp_path / "game.bin"
+    rom.write_bytes(b"abc")
+    cache = PersistentScanCache(tmp_path / "cache.sqlite", context="v1")
+    st = rom.stat()
+    cache.put("src", str(rom), st, {"system": "NES"})
+    cache.flush()
+    assert cache.get("src", str(rom), st) == {"system": "NES"}
+
+    # Same second, different nanoseconds -> stale.
+    os.utime(rom, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    assert cache.get("src", str(rom), rom.stat()) is None
+
+    # Other source partition is isolated.
+    assert cache.get("other", str(rom), st) is None
+
+    cache.context = "v2"
+    assert cache.get("src", str(rom), st) is None
+    assert cache.stats()["stale"] == 2
+    cache.close()
+
+
+def test_persistent_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    from src.scanning.scan_cache import PersistentScanCache
+
+    class FakeStat:
+        def __init__(self, idx: int) -> None:
+            self.st_size = idx
+            self.st_mtime_ns = idx
+            self.st_ino = idx
+
+    cache = PersistentScanCache(tmp_path / "cache.sqlite", max_entries=3, flush_batch=1)
+    for idx in range(3):
+        cache.put("src", f"/rom_{idx}", FakeStat(idx), {"id": idx})
+    assert cache.get("src", "/rom_0", FakeStat(0)) == {"id": 0}
+    cache.put("src", "/rom_3", FakeStat(3), {"id": 3})
+    cache.flush()
+
+    assert cache.stats()["size"] == 3
+    assert cache.get("src", "/rom_1", FakeStat(1)) is None
+    assert cache.get("src", "/rom_0", FakeStat(0)) == {"id": 0}
+    cache.close()
@@ -0,0 +1,59 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Ensure repo root on path
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _make_tree(root: Path, dirs: int = 5, files_per_dir: int = 6) -> int:
+    count = 0
+    for d in range(dirs):
+        sub = root / f"dir_{d}" / "nested"
+        sub.mkdir(parents=True)
+        for i in range(files_per_dir):
+            (sub / f"rom_{i}.nes").write_bytes(b"NES\x1a" + bytes([d, i]))
+            count += 1
+    return count
+
+
+def test_iter_files_is_lazy_and_respects_max_depth(tmp_path: Path) -> None:
+    from src.scanning.high_performance_scanner import HighPerformanceScanner
+
+    _make_tree(tmp_path)
+    (tmp_path / "top.nes").write_bytes(b"NES\x1a")
+
+    scanner = HighPerformanceScanner({})
+    walker = scanner._iter_files(str(tmp_path), True, None)
+    first = next(walker)
+    assert first == str(tmp_path / "top.nes")
+    assert scanner._walk_dirs_listed == 1
+
+    shallow = scanner._collect_files(str(tmp_path), recursive=True, file_types=None, max_depth=1)
+    assert shallow == [str(tmp_path / "top.nes")]
+
+
+def test_streaming_scan_reports_converging_totals(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.scanning.high_performance_scanner import HighPerformanceScanner
+
+    expected = _make_tree(tmp_path)
+    scanner = HighPerformanceScanner({"performance": {"optimization": {"enable_progress_batching": False}}})
+    monkeypatch.setattr(scanner, "_process_file", lambda path, *_a, **_k: {"path": path, "size": 1})
+
+    progress: list[tuple[int, int]] = []
+    found: list[str] = []
+    done = threading.Event()
+    scanner.on_progress = lambda current, total: progress.append((current, total))
+    scanner.on_rom_found = lambda info: found.append(info["path"])
+    scanner.on_complete = lambda _stats: done.set()
+
+    assert scanner.scan(str(tmp_path))
+    assert done.wait(timeout=10)
+
+    assert len(found) == expected
+    assert all(total >= current for current, total in progress)
+    assert progress[-1] == (expected, expected)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Microbenchmark platform heuristics on the shipped catalog.
+
+Compares the former per-call linear scan (catalog key + every platform and
+token per file) with the compiled catalog, per call and via evaluate_many().
+
+Usage:
+  python scripts/dev/bench_platform_heuristics.py --count 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.core import platform_heuristics as heuristics  # noqa: E402
+
+
+def _legacy_evaluate(path: str, container: Optional[str] = None) -> List[str]:
+    """Previous algorithm, kept here only as the baseline."""
+    platforms, _status, _policy = heuristics._load_catalog(heuristics._catalog_cache_key())
+    p = Path(path)
+    ext = p.suffix.lower()
+    container_type = (container or ext.lstrip(".")) or "raw"
+    haystack = heuristics._text_haystack(path)
+    scored: List[tuple] = []
+    for entry in platforms:
+        platform_id = str(entry.get("platform_id") or "").strip()
+        typical_exts = [x.lower() for x in heuristics._list_value(entry.get("typical_extensions"))]
+        allowed = [x.lower() for x in heuristics._list_value(entry.get("allowed_containers"))]
+        minimum = [x.lower() for x in heuristics._list_value(entry.get("minimum_signals"))]
+        score = 0.0
+        types: List[str] = []
+        if ext and ext in typical_exts:
+            score += 2.0
+            types.append("extension")
+        if allowed and container_type in allowed:
+            score += 1.0
+            types.append("container")
+        for token in heuristics._list_value(entry.get("positive_tokens")):
+            if heuristics._match_token(haystack, token):
+                score += 1.0
+                types.append("token")
+        for token in heuristics._list_value(entry.get("negative_tokens")):
+            if heuristics._match_token(haystack, token):
+                score -= 2.0
+                types.append("token")
+        if minimum and not all(req in types for req in minimum):
+            continue
+        if score > 0:
+            scored.append((-score, platform_id))
+    scored.sort()
+    return [pid for _score, pid in scored[:10]]
+
+
+def _make_paths(count: int, seed: int) -> List[str]:
+    platforms, _status, _policy = heuristics._load_catalog(heuristics._catalog_cache_key())
+    rng = random.Random(seed)
+    tokens = [str(t) for entry in platforms for t in heuristics._list_value(entry.get("positive_tokens"))]
+    exts = [str(e) for entry in platforms for e in heuristics._list_value(entry.get("typical_extensions"))]
+    exts += [".zip", ".7z", ".txt"]
+    paths = []
+    for idx in range(count):
+        folder = rng.choice(tokens) if tokens else "roms"
+        paths.append(f"/library/{folder}/Some Game {idx} (Europe) (Rev 1){rng.choice(exts)}")
+    return paths
+
+
+def _time(label: str, count: int, func) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    per_file_us = elapsed / max(1, count) * 1e6
+    print(f"{label:<10} files={count} elapsed={elapsed:.3f}s per_file={per_file_us:.1f}us")
+    return per_file_us
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    paths = _make_paths(args.count, args.seed)
+    # Warm catalog load and compilation outside the timed sections.
+    heuristics.evaluate_platform_candidates(paths[0])
+
+    results: Dict[str, float] = {}
+    results["legacy"] = _time("legacy", len(paths), lambda: [_legacy_evaluate(p) for p in paths])
+    results["compiled"] = _time(
+        "compiled", len(paths), lambda: [heuristics.evaluate_platform_candidates(p) for p in paths]
+    )
+    results["batch"] = _time("batch", len(paths), lambda: heuristics.evaluate_many(paths))
+
+    for mode in ("compiled", "batch"):
+        speedup = results["legacy"] / results[mode] if results[mode] > 0 else 0.0
+        print(f"speedup {mode}: {speedup:.1f}x")
+
+    mismatches = sum(
+        1
+        for p in paths[:500]
+        if _legacy_evaluate(p) != heuristics.evaluate_platform_candidates(p)["candidate_systems"]
+    )
+    print(f"mismatches (first 500): {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
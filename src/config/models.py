@@ -71,6 +71,12 @@ class ScannerConfig(_BaseConfigModel):
     use_cache: Optional[bool] = None
     recursive: Optional[bool] = None
     max_depth: Optional[int] = None
+    cache_max_size: Optional[int] = None
+    hash_backend: Optional[str] = None
+    hash_set: Optional[Any] = None
+    hash_processes: Optional[int] = None
+    dat_lookup_batch_size: Optional[int] = None
+    persistent_cache: Optional[Dict[str, Any]] = None
 
 
 class UiConfig(_BaseConfigModel):
@@ -104,6 +110,8 @@ class CacheConfig(_BaseConfigModel):
 
 class DatsConfig(_BaseConfigModel):
     import_paths: List[str] = Field(default_factory=list)
+    bulk_ingest: Optional[bool] = None
+    ingest_workers: Optional[int] = None
 
 
 class ProgressPersistenceConfig(_BaseConfigModel):
@@ -1,15 +1,26 @@
-"""SQLite-backed DAT index (incremental, portable)."""
+"""SQLite-backed DAT index (incremental, portable).
+
+Schema v2 stores hashes in binary form: SHA1/MD5 as BLOB, CRC32 as INTEGER.
+ROMs with a SHA1 live in the WITHOUT ROWID table ``rom_hashes_sha1`` (clustered
+on sha1, so a point lookup is a single B-tree descent); ROMs without SHA1 go to
+``rom_hashes_nosha1``. ``rom_hashes`` remains as a read-only hex view. v1 files
+(hex TEXT table) are migrated in place by ``_init_schema``.
+"""
 
 from __future__ import annotations
 
+import concurrent.futures
+import logging
 import os
 import sqlite3
 import zipfile
 import threading
 import hashlib
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Protocol
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Protocol, TypeVar
 import difflib
 import re
 try:
@@ -39,6 +50,78 @@ class DatHashRow:
     crc32: Optional[str]
     sha1: Optional[str]
     size_bytes: Optional[int]
+    md5: Optional[str] = None
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+
+# Dropped and rebuilt around bulk full rebuilds (the sha1 PRIMARY KEY stays).
+_SECONDARY_INDEXES: Tuple[Tuple[str, str], ...] = (
+    ("idx_rom_hashes_sha1_crc_size", "rom_hashes_sha1(crc32, size_bytes)"),
+    ("idx_rom_hashes_sha1_dat_id", "rom_hashes_sha1(dat_id)"),
+    ("idx_rom_hashes_nosha1_crc_size", "rom_hashes_nosha1(crc32, size_bytes)"),
+    ("idx_rom_hashes_nosha1_dat_id", "rom_hashes_nosha1(dat_id)"),
+    ("idx_game_names_dat_id", "game_names(dat_id)"),
+    ("idx_game_names_name", "game_names(game_name)"),
+)
+
+_HASH_COLUMNS = "dat_id, platform_id, rom_name, set_name, crc32, sha1, md5, size_bytes"
+_NOSHA1_COLUMNS = "dat_id, platform_id, rom_name, set_name, crc32, NULL AS sha1, md5, size_bytes"
+
+
+def _hex_to_bytes(value: Optional[str], length: int) -> Optional[bytes]:
+    text = str(value or "").strip().lower()
+    if len(text) != length * 2:
+        return None
+    try:
+        return bytes.fromhex(text)
+    except ValueError:
+        return None
+
+
+def _crc_to_int(value: object) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return value & 0xFFFFFFFF
+    text = str(value).strip().lower()
+    if not text or len(text) > 8:
+        return None
+    try:
+        return int(text, 16)
+    except ValueError:
+        return None
+
+
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER (999 on older builds).
+LOOKUP_BATCH_SIZE = 500
+# Idle read-only connections kept per index; busier moments open extra ones.
+READER_POOL_SIZE = 8
+
+_T = TypeVar("_T")
+
+
+def _row_to_hash_row(row: Any) -> DatHashRow:
+    crc32 = row["crc32"]
+    sha1 = row["sha1"]
+    md5 = row["md5"]
+    return DatHashRow(
+        dat_id=row["dat_id"],
+        platform_id=row["platform_id"],
+        rom_name=row["rom_name"],
+        set_name=row["set_name"],
+        crc32=f"{int(crc32):08x}" if crc32 is not None else None,
+        sha1=bytes(sha1).hex() if sha1 is not None else None,
+        size_bytes=row["size_bytes"],
+        md5=bytes(md5).hex() if md5 is not None else None,
+    )
+
+
+def _chunks(values: Sequence[_T], size: int = LOOKUP_BATCH_SIZE) -> Iterator[Sequence[_T]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
 
 
 class CancelEventProtocol(Protocol):
@@ -111,6 +194,180 @@ def _stable_shard_index(value: str, shard_count: int) -> int:
     return shard_key % max(1, shard_count)
 
 
+@dataclass(frozen=True)
+class DatGameRow:
+    dat_id: int
+    platform_id: Optional[str]
+    game_name: str
+
+
+def _parse_dat_file(
+    path: Path,
+    dat_id: int,
+    *,
+    cancel_event: Optional[CancelEventProtocol] = None,
+) -> Iterator[DatHashRow | DatGameRow]:
+    if _is_cancelled(cancel_event):
+        return
+    suffix = path.suffix.lower()
+    if suffix == ".zip":
+        with zipfile.ZipFile(str(path), "r") as zf:
+            for info in zf.infolist():
+                if _is_cancelled(cancel_event):
+                    return
+                if info.is_dir():
+                    continue
+                name = info.filename.lower()
+                if not (name.endswith(".dat") or name.endswith(".xml")):
+                    continue
+                with zf.open(info, "r") as fh:
+                    head = fh.read(64)
+                is_xml = name.endswith(".xml") or head.lstrip().startswith(b"<")
+                with zf.open(info, "r") as fh:
+                    yield from (
+                        _parse_logiqx_xml_stream(fh, dat_id, cancel_event=cancel_event)
+                        if is_xml
+                        else _parse_clrmamepro_text_stream(fh, dat_id, cancel_event=cancel_event)
+                    )
+        return
+
+    with open(path, "rb") as f:
+        head = f.read(64)
+    is_xml = head.lstrip().startswith(b"<") or suffix == ".xml"
+    with open(path, "rb") as f:
+        yield from (
+            _parse_logiqx_xml_stream(f, dat_id, cancel_event=cancel_event)
+            if is_xml
+            else _parse_clrmamepro_text_stream(f, dat_id, cancel_event=cancel_event)
+        )
+
+
+def _parse_logiqx_xml_stream(
+    stream,
+    dat_id: int,
+    *,
+    cancel_event: Optional[CancelEventProtocol] = None,
+) -> Iterator[DatHashRow | DatGameRow]:
+    context = ET.iterparse(stream, events=("start", "end"))  # nosec B314
+    _, root = next(context)
+    current_game_name: Optional[str] = None
+    dat_name: Optional[str] = None
+    platform_id: Optional[str] = None
+    event_count = 0
+    for event, elem in context:
+        if event_count % 500 == 0 and _is_cancelled(cancel_event):
+            return
+        event_count += 1
+        tag = elem.tag.lower() if isinstance(elem.tag, str) else ""
+        if event == "end" and tag.endswith("name") and elem.text and elem.text.strip():
+            if dat_name is None:
+                dat_name = elem.text.strip()
+                platform_id, _ = _normalize_system_name(dat_name)
+        if event == "start" and tag.endswith("game"):
+            current_game_name = (elem.attrib.get("name") or "").strip() or None
+            if current_game_name:
+                yield DatGameRow(dat_id, platform_id, current_game_name.lower())
+        if event == "end" and tag.endswith("rom"):
+            rom_name = (elem.attrib.get("name") or "").strip() or None
+            crc = (elem.attrib.get("crc") or "").strip().lower() or None
+            sha1 = (elem.attrib.get("sha1") or "").strip().lower() or None
+            md5 = (elem.attrib.get("md5") or "").strip().lower() or None
+            size = elem.attrib.get("size")
+            size_val = int(size) if size and str(size).isdigit() else None
+            yield DatHashRow(dat_id, platform_id, rom_name, current_game_name, crc, sha1, size_val, md5)
+            elem.clear()
+        if event == "end" and tag.endswith("game"):
+            current_game_name = None
+            elem.clear()
+
+
+_RE_CMP_ROM = re.compile(r"^\s*rom\s*\(", re.I)
+_RE_CMP_NAME = re.compile(r"\bname\s+\"([^\"]+)\"", re.I)
+_RE_CMP_CRC = re.compile(r"\bcrc\s+([0-9a-fA-F]{1,8})\b", re.I)
+_RE_CMP_SHA1 = re.compile(r"\bsha1\s+([0-9a-fA-F]{40})\b", re.I)
+_RE_CMP_MD5 = re.compile(r"\bmd5\s+([0-9a-fA-F]{32})\b", re.I)
+_RE_CMP_SIZE = re.compile(r"\bsize\s+([0-9]+)\b", re.I)
+_RE_CMP_HEADER = re.compile(r"^\s*(clrmamepro|header)\s*\(", re.I)
+
+
+def _parse_clrmamepro_text_stream(
+    stream,
+    dat_id: int,
+    *,
+    cancel_event: Optional[CancelEventProtocol] = None,
+) -> Iterator[DatHashRow | DatGameRow]:
+    game_name: Optional[str] = None
+    platform_id: Optional[str] = None
+    line_count = 0
+    for raw in stream:
+        if line_count % 500 == 0 and _is_cancelled(cancel_event):
+            return
+        line_count += 1
+        line = raw.decode("utf-8", errors="ignore") if isinstance(raw, bytes) else str(raw)
+        if _RE_CMP_HEADER.search(line) and "name" in line.lower():
+            m = _RE_CMP_NAME.search(line)
+            if m:
+                platform_id, _ = _normalize_system_name(m.group(1).strip())
+        if line.strip().lower().startswith("game"):
+            m = _RE_CMP_NAME.search(line)
+            if m:
+                game_name = m.group(1).strip()
+                if game_name:
+                    yield DatGameRow(dat_id, platform_id, game_name.lower())
+        if _RE_CMP_ROM.search(line):
+            rn = _RE_CMP_NAME.search(line)
+            rc = _RE_CMP_CRC.search(line)
+            rs = _RE_CMP_SHA1.search(line)
+            rm = _RE_CMP_MD5.search(line)
+            rz = _RE_CMP_SIZE.search(line)
+            yield DatHashRow(
+                dat_id,
+                platform_id,
+                rn.group(1).strip() if rn else None,
+                game_name,
+                rc.group(1).lower() if rc else None,
+                rs.group(1).lower() if rs else None,
+                int(rz.group(1)) if rz else None,
+                rm.group(1).lower() if rm else None,
+            )
+
+
+def _encode_hash_row(row: DatHashRow) -> Tuple[Optional[bytes], Tuple[Any, ...]]:
+    """Split a row into (sha1 BLOB or None, storage values without dat_id)."""
+    values = (
+        row.platform_id,
+        row.rom_name,
+        row.set_name,
+        row.size_bytes,
+        _crc_to_int(row.crc32),
+        _hex_to_bytes(row.md5, 16),
+    )
+    return _hex_to_bytes(row.sha1, 20), values
+
+
+def _parse_dat_job(
+    path: str,
+) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]], List[Tuple[Any, ...]], float]:
+    """Process-pool entry point: parse one DAT into storage-ready tuples (no dat_id yet)."""
+    start = time.perf_counter()
+    with_sha1: List[Tuple[Any, ...]] = []
+    without_sha1: List[Tuple[Any, ...]] = []
+    games: List[Tuple[Any, ...]] = []
+    for item in _parse_dat_file(Path(path), 0):
+        if isinstance(item, DatGameRow):
+            games.append((item.platform_id, item.game_name))
+            continue
+        sha1, values = _encode_hash_row(item)
+        if sha1 is None:
+            without_sha1.append(values)
+        else:
+            with_sha1.append((sha1,) + values)
+    # Key order keeps inserts into the clustered SHA1 table on adjacent pages;
+    # the sort is stable, so the first duplicate still wins.
+    with_sha1.sort(key=lambda values: values[0])
+    return with_sha1, without_sha1, games, time.perf_counter() - start
+
+
 class DatIndexSqlite:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
@@ -120,6 +377,12 @@ class DatIndexSqlite:
         self.conn.row_factory = sqlite3.Row
         self._apply_pragmas()
         self._init_schema()
+        # Pooled read-only WAL connections: lookups from scanner threads run in
+        # parallel instead of queueing on self._lock.
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._readers_enabled = True
+        self._closed = False
 
     @classmethod
     def from_config(cls, config: Optional[object] = None) -> "DatIndexSqlite":
@@ -129,11 +392,61 @@ class DatIndexSqlite:
         return cls(Path(index_path))
 
     def close(self) -> None:
+        with self._readers_lock:
+            self._closed = True
+            readers, self._readers = self._readers, []
+        for reader in readers:
+            try:
+                reader.close()
+            except Exception:
+                continue
         try:
             self.conn.close()
         except Exception:
             return
 
+    def _open_reader(self) -> Optional[sqlite3.Connection]:
+        try:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            reader = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            reader.row_factory = sqlite3.Row
+            reader.execute("PRAGMA query_only=ON")
+            reader.execute("PRAGMA cache_size=-8000")
+            reader.execute("PRAGMA mmap_size=268435456")
+            reader.execute("PRAGMA busy_timeout=3000")
+            return reader
+        except Exception:
+            # e.g. read-only media without -shm: fall back to the shared connection.
+            self._readers_enabled = False
+            return None
+
+    @contextmanager
+    def _read_conn(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection for read-only queries (pooled reader or locked main connection)."""
+        reader: Optional[sqlite3.Connection] = None
+        if self._readers_enabled:
+            with self._readers_lock:
+                if self._readers:
+                    reader = self._readers.pop()
+            if reader is None:
+                reader = self._open_reader()
+        if reader is None:
+            with self._lock:
+                yield self.conn
+            return
+        try:
+            yield reader
+        finally:
+            with self._readers_lock:
+                keep = not self._closed and len(self._readers) < READER_POOL_SIZE
+                if keep:
+                    self._readers.append(reader)
+            if not keep:
+                try:
+                    reader.close()
+                except Exception:
+                    pass
+
     def _apply_pragmas(self) -> None:
         cur = self.conn.cursor()
         cur.execute("PRAGMA journal_mode=WAL")
@@ -163,14 +476,28 @@ class DatIndexSqlite:
         )
         cur.execute(
             """
-            CREATE TABLE IF NOT EXISTS rom_hashes (
+            CREATE TABLE IF NOT EXISTS rom_hashes_sha1 (
+                sha1 BLOB PRIMARY KEY,
                 dat_id INTEGER NOT NULL,
                 platform_id TEXT,
                 rom_name TEXT,
                 set_name TEXT,
-                crc32 TEXT,
-                sha1 TEXT,
-                size_bytes INTEGER
+                size_bytes INTEGER,
+                crc32 INTEGER,
+                md5 BLOB
+            ) WITHOUT ROWID
+            """
+        )
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rom_hashes_nosha1 (
+                dat_id INTEGER NOT NULL,
+                platform_id TEXT,
+                rom_name TEXT,
+                set_name TEXT,
+                size_bytes INTEGER,
+                crc32 INTEGER,
+                md5 BLOB
             )
             """
         )
@@ -183,13 +510,62 @@ class DatIndexSqlite:
             )
             """
         )
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_rom_hashes_crc_size ON rom_hashes(crc32, size_bytes)")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_rom_hashes_dat_id ON rom_hashes(dat_id)")
-        cur.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_rom_hashes_sha1 ON rom_hashes(sha1) WHERE sha1 IS NOT NULL")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_game_names_dat_id ON game_names(dat_id)")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_game_names_name ON game_names(game_name)")
+        cur.execute("SELECT type FROM sqlite_master WHERE name='rom_hashes'")
+        legacy = cur.fetchone()
+        if legacy and str(legacy[0]) == "table":
+            self._migrate_text_hashes()
+        cur.execute(
+            """
+            CREATE VIEW IF NOT EXISTS rom_hashes AS
+            SELECT dat_id, platform_id, rom_name, set_name,
+                   CASE WHEN crc32 IS NULL THEN NULL ELSE printf('%08x', crc32) END AS crc32,
+                   lower(hex(sha1)) AS sha1,
+                   CASE WHEN md5 IS NULL THEN NULL ELSE lower(hex(md5)) END AS md5,
+                   size_bytes
+            FROM rom_hashes_sha1
+            UNION ALL
+            SELECT dat_id, platform_id, rom_name, set_name,
+                   CASE WHEN crc32 IS NULL THEN NULL ELSE printf('%08x', crc32) END AS crc32,
+                   NULL AS sha1,
+                   CASE WHEN md5 IS NULL THEN NULL ELSE lower(hex(md5)) END AS md5,
+                   size_bytes
+            FROM rom_hashes_nosha1
+            """
+        )
+        self._create_secondary_indexes()
+        cur.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
         self.conn.commit()
 
+    def _create_secondary_indexes(self) -> None:
+        cur = self.conn.cursor()
+        for name, ddl in _SECONDARY_INDEXES:
+            cur.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {ddl}")
+
+    def _drop_secondary_indexes(self) -> None:
+        cur = self.conn.cursor()
+        for name, _ddl in _SECONDARY_INDEXES:
+            cur.execute(f"DROP INDEX IF EXISTS {name}")
+
+    def _migrate_text_hashes(self) -> None:
+        """In-place v1 -> v2 migration: hex TEXT ``rom_hashes`` table into the binary tables."""
+        logger.info("Migriere DAT-Index auf binäres Hash-Schema: %s", self.db_path)
+        src = self.conn.cursor()
+        src.execute("SELECT dat_id, platform_id, rom_name, set_name, crc32, sha1, size_bytes FROM rom_hashes")
+        migrated = 0
+        while True:
+            chunk = src.fetchmany(10000)
+            if not chunk:
+                break
+            migrated += self._insert_rows([DatHashRow(*tuple(row)) for row in chunk])
+        self.conn.execute("DROP TABLE rom_hashes")
+        self.conn.commit()
+        logger.info("DAT-Index migriert: %s Hash-Zeilen", migrated)
+        try:
+            # Give the freed TEXT pages back to the filesystem.
+            self.conn.execute("VACUUM")
+        except sqlite3.Error as exc:
+            logger.warning("VACUUM nach DAT-Index-Migration fehlgeschlagen: %s", exc)
+
     def _file_signature(self, path: Path) -> Tuple[int, int, Optional[str]]:
         stat = path.stat()
         mtime = int(stat.st_mtime)
@@ -234,28 +610,89 @@ class DatIndexSqlite:
 
     def _clear_dat_rows(self, dat_id: int) -> None:
         cur = self.conn.cursor()
-        cur.execute("DELETE FROM rom_hashes WHERE dat_id=?", (dat_id,))
+        cur.execute("DELETE FROM rom_hashes_sha1 WHERE dat_id=?", (dat_id,))
+        cur.execute("DELETE FROM rom_hashes_nosha1 WHERE dat_id=?", (dat_id,))
         cur.execute("DELETE FROM game_names WHERE dat_id=?", (dat_id,))
 
     def _insert_rows(self, rows: List[DatHashRow]) -> int:
+        with_sha1: List[Tuple[Any, ...]] = []
+        without_sha1: List[Tuple[Any, ...]] = []
+        for r in rows:
+            sha1, values = _encode_hash_row(r)
+            if sha1 is None:
+                without_sha1.append((r.dat_id,) + values)
+            else:
+                with_sha1.append((sha1, r.dat_id) + values)
+        return self._insert_encoded(with_sha1, without_sha1)
+
+    def _insert_encoded(self, with_sha1: List[Tuple[Any, ...]], without_sha1: List[Tuple[Any, ...]]) -> int:
         cur = self.conn.cursor()
         before = int(self.conn.total_changes)
-        cur.executemany(
-            "INSERT OR IGNORE INTO rom_hashes (dat_id, platform_id, rom_name, set_name, crc32, sha1, size_bytes) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            [(r.dat_id, r.platform_id, r.rom_name, r.set_name, r.crc32, r.sha1, r.size_bytes) for r in rows],
-        )
+        if with_sha1:
+            cur.executemany(
+                "INSERT OR IGNORE INTO rom_hashes_sha1 (sha1, dat_id, platform_id, rom_name, set_name, size_bytes, crc32, md5) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                with_sha1,
+            )
+        if without_sha1:
+            cur.executemany(
+                "INSERT INTO rom_hashes_nosha1 (dat_id, platform_id, rom_name, set_name, size_bytes, crc32, md5) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                without_sha1,
+            )
         after = int(self.conn.total_changes)
         return max(after - before, 0)
 
+    def insert_rows(self, rows: Iterable[DatHashRow]) -> int:
+        """Insert hash rows (hex strings, as in :class:`DatHashRow`) and commit."""
+        with self._lock:
+            inserted = self._insert_rows(list(rows))
+            self.conn.commit()
+        return inserted
+
     def reset_index(self) -> None:
         with self._lock:
             cur = self.conn.cursor()
-            cur.execute("DELETE FROM rom_hashes")
+            cur.execute("DELETE FROM rom_hashes_sha1")
+            cur.execute("DELETE FROM rom_hashes_nosha1")
             cur.execute("DELETE FROM game_names")
             cur.execute("DELETE FROM dat_files")
             self.conn.commit()
 
-    def ingest(self, paths: Iterable[str], *, cancel_event: Optional[CancelEventProtocol] = None) -> Dict[str, int]:
+    def _insert_game_names(self, rows: List[Tuple[int, Optional[str], str]]) -> None:
+        if rows:
+            self.conn.cursor().executemany(
+                "INSERT INTO game_names (dat_id, platform_id, game_name) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def _needs_ingest(self, path: Path) -> bool:
+        cur = self.conn.cursor()
+        cur.execute("SELECT mtime, size_bytes, active FROM dat_files WHERE source_path=?", (str(path),))
+        row = cur.fetchone()
+        if not row or not int(row["active"] or 0):
+            return True
+        mtime, size, _ = self._file_signature(path)
+        return not (int(row["mtime"] or 0) == mtime and int(row["size_bytes"] or 0) == size)
+
+    def ingest(
+        self,
+        paths: Iterable[str],
+        *,
+        cancel_event: Optional[CancelEventProtocol] = None,
+        bulk: bool = False,
+        workers: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Dict[str, Any]:
+        """Ingest DAT files incrementally (unchanged files are skipped).
+
+        ``bulk=True`` parses changed DATs in a process pool (or ``executor``),
+        writes with ``synchronous=OFF`` and, when every DAT changed, rebuilds the
+        secondary indexes once at the end. The result then carries ``timings``.
+        """
+        if bulk:
+            return self._ingest_bulk(paths, cancel_event=cancel_event, workers=workers, executor=executor)
+
         processed = 0
         skipped = 0
         inserted = 0
@@ -280,11 +717,15 @@ class DatIndexSqlite:
                 self._clear_dat_rows(dat_id)
                 rows_iter = self._parse_dat_file(file_path, dat_id, cancel_event=cancel_event)
                 batch: List[DatHashRow] = []
+                games: List[Tuple[int, Optional[str], str]] = []
                 cancelled = False
                 for row in rows_iter:
                     if _is_cancelled(cancel_event):
                         cancelled = True
                         break
+                    if isinstance(row, DatGameRow):
+                        games.append((row.dat_id, row.platform_id, row.game_name))
+                        continue
                     batch.append(row)
                     if len(batch) >= 10000:
                         inserted += self._insert_rows(batch)
@@ -294,14 +735,123 @@ class DatIndexSqlite:
                     break
                 if batch:
                     inserted += self._insert_rows(batch)
+                self._insert_game_names(games)
                 self.conn.commit()
                 processed += 1
 
         return {"processed": processed, "skipped": skipped, "inserted": inserted, "removed": removed}
 
-    def coverage_report(self) -> Dict[str, object]:
+    def _ingest_bulk(
+        self,
+        paths: Iterable[str],
+        *,
+        cancel_event: Optional[CancelEventProtocol] = None,
+        workers: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Dict[str, Any]:
+        timings: Dict[str, float] = {"collect": 0.0, "parse": 0.0, "insert": 0.0, "index": 0.0}
+        processed = 0
+        skipped = 0
+        inserted = 0
+        removed = 0
+        started = time.perf_counter()
+
         with self._lock:
-            cur = self.conn.cursor()
+            phase = time.perf_counter()
+            file_paths = self._collect_dat_files(paths)
+            removed = self._deactivate_missing_paths({str(path) for path in file_paths})
+            pending = [path for path in file_paths if self._needs_ingest(path)]
+            skipped = len(file_paths) - len(pending)
+            # Full rebuild: every DAT changed, so all hash rows are replaced anyway.
+            full_rebuild = bool(pending) and not skipped
+            timings["collect"] = time.perf_counter() - phase
+
+            if not pending:
+                return {"processed": 0, "skipped": skipped, "inserted": 0, "removed": removed, "timings": timings}
+
+            self.conn.execute("PRAGMA synchronous=OFF")
+            self.conn.execute("PRAGMA cache_size=-262144")
+            if full_rebuild:
+                self._drop_secondary_indexes()
+                self.conn.execute("DELETE FROM rom_hashes_sha1")
+                self.conn.execute("DELETE FROM rom_hashes_nosha1")
+                self.conn.execute("DELETE FROM game_names")
+                self.conn.commit()
+
+            own_executor = None
+            futures: Dict[concurrent.futures.Future, Path] = {}
+            worker_count = max(1, min(len(pending), int(workers or os.cpu_count() or 1)))
+            if executor is None and worker_count > 1:
+                own_executor = concurrent.futures.ProcessPoolExecutor(max_workers=worker_count)
+                executor = own_executor
+
+            try:
+                if executor is None:
+                    results: Iterator[Tuple[Path, Any]] = ((path, _parse_dat_job(str(path))) for path in pending)
+                else:
+                    futures = {executor.submit(_parse_dat_job, str(path)): path for path in pending}
+                    # Consume in submission order: on duplicate SHA1s the first DAT
+                    # wins, exactly as in the sequential import.
+                    results = ((path, future.result()) for future, path in futures.items())
+
+                wait_start = time.perf_counter()
+                for path, (with_sha1, without_sha1, games, parse_seconds) in results:
+                    timings["parse"] += parse_seconds
+                    if _is_cancelled(cancel_event):
+                        break
+                    phase = time.perf_counter()
+                    dat_id, _changed = self._ensure_dat_file(path)
+                    if not dat_id:
+                        continue
+                    self.conn.execute("UPDATE dat_files SET active=1 WHERE dat_id=?", (dat_id,))
+                    if not full_rebuild:
+                        self._clear_dat_rows(dat_id)
+                    inserted += self._insert_encoded(
+                        [(row[0], dat_id) + row[1:] for row in with_sha1],
+                        [(dat_id,) + row for row in without_sha1],
+                    )
+                    self._insert_game_names([(dat_id, platform_id, name) for platform_id, name in games])
+                    self.conn.commit()
+                    processed += 1
+                    timings["insert"] += time.perf_counter() - phase
+                timings["parse_wall"] = time.perf_counter() - wait_start - timings["insert"]
+            finally:
+                for future in futures:
+                    future.cancel()
+                if own_executor is not None:
+                    own_executor.shutdown(wait=False, cancel_futures=True)
+                self.conn.rollback()
+                if full_rebuild:
+                    phase = time.perf_counter()
+                    self._create_secondary_indexes()
+                    self.conn.commit()
+                    timings["index"] = time.perf_counter() - phase
+                self.conn.execute("PRAGMA synchronous=NORMAL")
+                self.conn.execute("PRAGMA cache_size=-20000")
+
+        timings["total"] = time.perf_counter() - started
+        logger.info(
+            "DAT-Import (bulk) %s: %s Dateien, %s Zeilen | collect=%.2fs parse=%.2fs insert=%.2fs index=%.2fs total=%.2fs",
+            self.db_path,
+            processed,
+            inserted,
+            timings["collect"],
+            timings["parse"],
+            timings["insert"],
+            timings["index"],
+            timings["total"],
+        )
+        return {
+            "processed": processed,
+            "skipped": skipped,
+            "inserted": inserted,
+            "removed": removed,
+            "timings": timings,
+        }
+
+    def coverage_report(self) -> Dict[str, object]:
+        with self._read_conn() as conn:
+            cur = conn.cursor()
             cur.execute("SELECT COUNT(*) AS count FROM dat_files WHERE active=1")
             active_files = int(cur.fetchone()[0])
             cur.execute("SELECT COUNT(*) AS count FROM dat_files WHERE active=0")
@@ -367,173 +917,41 @@ class DatIndexSqlite:
         dat_id: int,
         *,
         cancel_event: Optional[CancelEventProtocol] = None,
-    ) -> Iterator[DatHashRow]:
-        if _is_cancelled(cancel_event):
-            return
-        suffix = path.suffix.lower()
-        if suffix == ".zip":
-            with zipfile.ZipFile(str(path), "r") as zf:
-                for info in zf.infolist():
-                    if _is_cancelled(cancel_event):
-                        return
-                    if info.is_dir():
-                        continue
-                    name = info.filename.lower()
-                    if not (name.endswith(".dat") or name.endswith(".xml")):
-                        continue
-                    with zf.open(info, "r") as fh:
-                        head = fh.read(64)
-                    is_xml = name.endswith(".xml") or head.lstrip().startswith(b"<")
-                    with zf.open(info, "r") as fh:
-                        yield from (
-                            self._parse_logiqx_xml_stream(fh, dat_id, cancel_event=cancel_event)
-                            if is_xml
-                            else self._parse_clrmamepro_text_stream(fh, dat_id, cancel_event=cancel_event)
-                        )
-            return
-
-        with open(path, "rb") as f:
-            head = f.read(64)
-        is_xml = head.lstrip().startswith(b"<") or suffix == ".xml"
-        with open(path, "rb") as f:
-            yield from (
-                self._parse_logiqx_xml_stream(f, dat_id, cancel_event=cancel_event)
-                if is_xml
-                else self._parse_clrmamepro_text_stream(f, dat_id, cancel_event=cancel_event)
-            )
-
-    def _parse_logiqx_xml_stream(
-        self,
-        stream,
-        dat_id: int,
-        *,
-        cancel_event: Optional[CancelEventProtocol] = None,
-    ) -> Iterator[DatHashRow]:
-        context = ET.iterparse(stream, events=("start", "end"))  # nosec B314
-        _, root = next(context)
-        current_game_name: Optional[str] = None
-        dat_name: Optional[str] = None
-        platform_id: Optional[str] = None
-        event_count = 0
-        for event, elem in context:
-            if event_count % 500 == 0 and _is_cancelled(cancel_event):
-                return
-            event_count += 1
-            tag = elem.tag.lower() if isinstance(elem.tag, str) else ""
-            if event == "end" and tag.endswith("name") and elem.text and elem.text.strip():
-                if dat_name is None:
-                    dat_name = elem.text.strip()
-                    platform_id, _ = _normalize_system_name(dat_name)
-            if event == "start" and tag.endswith("game"):
-                current_game_name = (elem.attrib.get("name") or "").strip() or None
-                if current_game_name:
-                    cur = self.conn.cursor()
-                    cur.execute(
-                        "INSERT INTO game_names (dat_id, platform_id, game_name) VALUES (?, ?, ?)",
-                        (dat_id, platform_id, current_game_name.lower()),
-                    )
-            if event == "end" and tag.endswith("rom"):
-                rom_name = (elem.attrib.get("name") or "").strip() or None
-                crc = (elem.attrib.get("crc") or "").strip().lower() or None
-                sha1 = (elem.attrib.get("sha1") or "").strip().lower() or None
-                size = elem.attrib.get("size")
-                size_val = int(size) if size and str(size).isdigit() else None
-                yield DatHashRow(dat_id, platform_id, rom_name, current_game_name, crc, sha1, size_val)
-                elem.clear()
-            if event == "end" and tag.endswith("game"):
-                current_game_name = None
-                elem.clear()
-
-    def _parse_clrmamepro_text_stream(
-        self,
-        stream,
-        dat_id: int,
-        *,
-        cancel_event: Optional[CancelEventProtocol] = None,
-    ) -> Iterator[DatHashRow]:
-        import re
-        re_rom = re.compile(r"^\s*rom\s*\(", re.I)
-        re_name = re.compile(r"\bname\s+\"([^\"]+)\"", re.I)
-        re_crc = re.compile(r"\bcrc\s+([0-9a-fA-F]{1,8})\b", re.I)
-        re_sha1 = re.compile(r"\bsha1\s+([0-9a-fA-F]{40})\b", re.I)
-        re_size = re.compile(r"\bsize\s+([0-9]+)\b", re.I)
-        re_header = re.compile(r"^\s*(clrmamepro|header)\s*\(", re.I)
-        game_name: Optional[str] = None
-        dat_name: Optional[str] = None
-        platform_id: Optional[str] = None
-        line_count = 0
-        for raw in stream:
-            if line_count % 500 == 0 and _is_cancelled(cancel_event):
-                return
-            line_count += 1
-            line = raw.decode("utf-8", errors="ignore") if isinstance(raw, bytes) else str(raw)
-            if re_header.search(line) and "name" in line.lower():
-                m = re_name.search(line)
-                if m:
-                    name = m.group(1).strip()
-                    dat_name = name
-                    platform_id, _ = _normalize_system_name(name)
-            if line.strip().lower().startswith("game"):
-                m = re_name.search(line)
-                if m:
-                    game_name = m.group(1).strip()
-                    if game_name:
-                        cur = self.conn.cursor()
-                        cur.execute(
-                            "INSERT INTO game_names (dat_id, platform_id, game_name) VALUES (?, ?, ?)",
-                            (dat_id, platform_id, game_name.lower()),
-                        )
-            if re_rom.search(line):
-                rn = re_name.search(line)
-                rc = re_crc.search(line)
-                rs = re_sha1.search(line)
-                rz = re_size.search(line)
-                yield DatHashRow(
-                    dat_id,
-                    platform_id,
-                    rn.group(1).strip() if rn else None,
-                    game_name,
-                    rc.group(1).lower() if rc else None,
-                    rs.group(1).lower() if rs else None,
-                    int(rz.group(1)) if rz else None,
-                )
+    ) -> Iterator[DatHashRow | DatGameRow]:
+        return _parse_dat_file(path, dat_id, cancel_event=cancel_event)
 
     def lookup_sha1(self, sha1: str) -> Optional[DatHashRow]:
-        with self._lock:
-            cur = self.conn.cursor()
-            cur.execute("SELECT * FROM rom_hashes WHERE sha1=? LIMIT 1", (sha1.lower(),))
+        key = _hex_to_bytes(sha1, 20)
+        if key is None:
+            return None
+        with self._read_conn() as conn:
+            cur = conn.cursor()
+            cur.execute(f"SELECT {_HASH_COLUMNS} FROM rom_hashes_sha1 WHERE sha1=?", (key,))
             row = cur.fetchone()
         if not row:
             return None
-        return DatHashRow(
-            dat_id=row["dat_id"],
-            platform_id=row["platform_id"],
-            rom_name=row["rom_name"],
-            set_name=row["set_name"],
-            crc32=row["crc32"],
-            sha1=row["sha1"],
-            size_bytes=row["size_bytes"],
-        )
+        return _row_to_hash_row(row)
 
     def lookup_sha1_all(self, sha1: str) -> List[DatHashRow]:
-        with self._lock:
-            cur = self.conn.cursor()
-            cur.execute("SELECT * FROM rom_hashes WHERE sha1=?", (sha1.lower(),))
-            rows = cur.fetchall()
-        results: List[DatHashRow] = []
-        for row in rows or []:
-            results.append(
-                DatHashRow(
-                    dat_id=row["dat_id"],
-                    platform_id=row["platform_id"],
-                    rom_name=row["rom_name"],
-                    set_name=row["set_name"],
-                    crc32=row["crc32"],
-                    sha1=row["sha1"],
-                    size_bytes=row["size_bytes"],
-                )
-            )
-        return results
+        # sha1 is the primary key: at most one row.
+        row = self.lookup_sha1(sha1)
+        return [row] if row else []
+
+    def lookup_sha1_many(self, sha1s: Iterable[str]) -> Dict[str, DatHashRow]:
+        """Batched :meth:`lookup_sha1`: ``{sha1_lower: row}`` for every hit (IN batches)."""
+        keys = [key for key in dict.fromkeys(_hex_to_bytes(value, 20) for value in sha1s) if key is not None]
+        found: Dict[str, DatHashRow] = {}
+        if not keys:
+            return found
+        with self._read_conn() as conn:
+            cur = conn.cursor()
+            for chunk in _chunks(keys):
+                placeholders = ",".join("?" for _ in chunk)
+                cur.execute(f"SELECT {_HASH_COLUMNS} FROM rom_hashes_sha1 WHERE sha1 IN ({placeholders})", list(chunk))
+                for row in cur.fetchall():
+                    hash_row = _row_to_hash_row(row)
+                    found[str(hash_row.sha1)] = hash_row
+        return found
 
     def fuzzy_game_matches(
         self,
@@ -552,8 +970,8 @@ class DatIndexSqlite:
         tokens = norm.split()
         seed = tokens[0]
         like = f"%{seed}%"
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._read_conn() as conn:
+            cur = conn.cursor()
             cur.execute(
                 "SELECT platform_id, game_name FROM game_names WHERE game_name LIKE ? LIMIT ?",
                 (like, int(search_limit)),
@@ -580,53 +998,72 @@ class DatIndexSqlite:
         scored.sort(key=lambda x: float(x.get("score", 0.0)), reverse=True)
         return scored[: max(1, int(limit))]
 
+    # ROMs with SHA1 are listed first, so *_when_sha1_missing only falls back to
+    # CRC32+size when no SHA1-bearing DAT entry shares that CRC32+size.
+    _CRC_SIZE_QUERY = (
+        f"SELECT {_HASH_COLUMNS} FROM rom_hashes_sha1 WHERE crc32=? AND size_bytes=? "
+        f"UNION ALL SELECT {_NOSHA1_COLUMNS} FROM rom_hashes_nosha1 WHERE crc32=? AND size_bytes=?"
+    )
+
     def lookup_crc_size(self, crc32: str, size_bytes: int) -> Optional[DatHashRow]:
-        with self._lock:
-            cur = self.conn.cursor()
-            cur.execute("SELECT * FROM rom_hashes WHERE crc32=? AND size_bytes=? LIMIT 1", (crc32.lower(), int(size_bytes)))
+        crc_value = _crc_to_int(crc32)
+        if crc_value is None:
+            return None
+        params = (crc_value, int(size_bytes), crc_value, int(size_bytes))
+        with self._read_conn() as conn:
+            cur = conn.cursor()
+            cur.execute(f"{self._CRC_SIZE_QUERY} LIMIT 1", params)
             row = cur.fetchone()
         if not row:
             return None
-        return DatHashRow(
-            dat_id=row["dat_id"],
-            platform_id=row["platform_id"],
-            rom_name=row["rom_name"],
-            set_name=row["set_name"],
-            crc32=row["crc32"],
-            sha1=row["sha1"],
-            size_bytes=row["size_bytes"],
-        )
+        return _row_to_hash_row(row)
 
     def lookup_crc_size_all(self, crc32: str, size_bytes: int) -> List[DatHashRow]:
-        with self._lock:
-            cur = self.conn.cursor()
-            cur.execute(
-                "SELECT * FROM rom_hashes WHERE crc32=? AND size_bytes=?",
-                (crc32.lower(), int(size_bytes)),
-            )
+        crc_value = _crc_to_int(crc32)
+        if crc_value is None:
+            return []
+        params = (crc_value, int(size_bytes), crc_value, int(size_bytes))
+        with self._read_conn() as conn:
+            cur = conn.cursor()
+            cur.execute(self._CRC_SIZE_QUERY, params)
             rows = cur.fetchall()
-        results: List[DatHashRow] = []
-        for row in rows or []:
-            results.append(
-                DatHashRow(
-                    dat_id=row["dat_id"],
-                    platform_id=row["platform_id"],
-                    rom_name=row["rom_name"],
-                    set_name=row["set_name"],
-                    crc32=row["crc32"],
-                    sha1=row["sha1"],
-                    size_bytes=row["size_bytes"],
-                )
-            )
-        return results
+        return [_row_to_hash_row(row) for row in rows or []]
+
+    def lookup_crc_size_many(self, pairs: Iterable[Tuple[str, int]]) -> Dict[Tuple[str, int], DatHashRow]:
+        """Batched :meth:`lookup_crc_size`: ``{(crc32_hex8, size): row}`` for every hit."""
+        wanted: set[Tuple[int, int]] = set()
+        for crc, size in pairs:
+            crc_value = _crc_to_int(crc)
+            if crc_value is not None and size is not None:
+                wanted.add((crc_value, int(size)))
+        found: Dict[Tuple[str, int], DatHashRow] = {}
+        if not wanted:
+            return found
+        crcs = sorted({crc for crc, _size in wanted})
+        with self._read_conn() as conn:
+            cur = conn.cursor()
+            for table, columns in (("rom_hashes_sha1", _HASH_COLUMNS), ("rom_hashes_nosha1", _NOSHA1_COLUMNS)):
+                for chunk in _chunks(crcs):
+                    placeholders = ",".join("?" for _ in chunk)
+                    cur.execute(f"SELECT {columns} FROM {table} WHERE crc32 IN ({placeholders})", list(chunk))
+                    for row in cur.fetchall():
+                        key = (int(row["crc32"]), int(row["size_bytes"] or 0))
+                        if key in wanted:
+                            found.setdefault((f"{key[0]:08x}", key[1]), _row_to_hash_row(row))
+        return found
+
+    def lookup_crc_size_when_sha1_missing_many(
+        self, pairs: Iterable[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], DatHashRow]:
+        return {key: row for key, row in self.lookup_crc_size_many(pairs).items() if not row.sha1}
 
     def get_dat_sources_by_ids(self, dat_ids: Iterable[int]) -> Dict[int, str]:
         ids = [int(val) for val in dat_ids]
         if not ids:
             return {}
         placeholders = ",".join("?" for _ in ids)
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._read_conn() as conn:
+            cur = conn.cursor()
             cur.execute(
                 f"SELECT dat_id, source_path FROM dat_files WHERE dat_id IN ({placeholders})",
                 ids,
@@ -646,11 +1083,22 @@ class DatIndexSqlite:
             return row
         return None
 
+    def content_signature(self) -> str:
+        """Return a cheap fingerprint of the active DAT set (changes on re-ingest)."""
+        with self._read_conn() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT COUNT(*), COALESCE(MAX(dat_id), 0), COALESCE(SUM(mtime), 0), COALESCE(SUM(size_bytes), 0) "
+                "FROM dat_files WHERE active=1"
+            )
+            row = cur.fetchone()
+        return ":".join(str(int(val or 0)) for val in row)
+
     def lookup_game(self, game_name: str) -> Optional[Tuple[str, int]]:
         if not game_name:
             return None
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._read_conn() as conn:
+            cur = conn.cursor()
             cur.execute(
                 "SELECT platform_id, dat_id FROM game_names WHERE game_name=? LIMIT 1",
                 (str(game_name).lower(),),
@@ -664,37 +1112,84 @@ class DatIndexSqlite:
 class MultiDatIndexSqlite:
     def __init__(self, shard_paths: Iterable[Path]) -> None:
         self._indexes = [DatIndexSqlite(path) for path in shard_paths]
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
     def close(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
         for index in self._indexes:
             try:
                 index.close()
             except Exception:
                 continue
 
+    def _fan_out(self, func: Callable[[DatIndexSqlite], _T]) -> List[_T]:
+        """Run ``func`` on every shard concurrently; results keep shard order."""
+        if len(self._indexes) <= 1:
+            return [func(index) for index in self._indexes]
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(self._indexes),
+                    thread_name_prefix="dat-shard",
+                )
+            executor = self._executor
+        futures = [executor.submit(func, index) for index in self._indexes]
+        return [future.result() for future in futures]
+
     def lookup_sha1(self, sha1: str) -> Optional[DatHashRow]:
-        for index in self._indexes:
-            result = index.lookup_sha1(sha1)
+        for result in self._fan_out(lambda index: index.lookup_sha1(sha1)):
             if result:
                 return result
         return None
 
     def lookup_sha1_all(self, sha1: str) -> List[DatHashRow]:
         results: List[DatHashRow] = []
-        for index in self._indexes:
-            results.extend(index.lookup_sha1_all(sha1))
+        for rows in self._fan_out(lambda index: index.lookup_sha1_all(sha1)):
+            results.extend(rows)
         return results
 
+    def lookup_sha1_many(self, sha1s: Iterable[str]) -> Dict[str, DatHashRow]:
+        wanted = list(sha1s)
+        merged: Dict[str, DatHashRow] = {}
+        # Earlier shards win, as in the single-key lookups.
+        for found in self._fan_out(lambda index: index.lookup_sha1_many(wanted)):
+            for key, row in found.items():
+                merged.setdefault(key, row)
+        return merged
+
     def lookup_crc_size_when_sha1_missing(self, crc32: str, size_bytes: int) -> Optional[DatHashRow]:
-        for index in self._indexes:
-            result = index.lookup_crc_size_when_sha1_missing(crc32, size_bytes)
+        for result in self._fan_out(lambda index: index.lookup_crc_size_when_sha1_missing(crc32, size_bytes)):
             if result:
                 return result
         return None
 
+    def lookup_crc_size_many(self, pairs: Iterable[Tuple[str, int]]) -> Dict[Tuple[str, int], DatHashRow]:
+        wanted = list(pairs)
+        merged: Dict[Tuple[str, int], DatHashRow] = {}
+        for found in self._fan_out(lambda index: index.lookup_crc_size_many(wanted)):
+            for key, row in found.items():
+                merged.setdefault(key, row)
+        return merged
+
+    def lookup_crc_size_when_sha1_missing_many(
+        self, pairs: Iterable[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], DatHashRow]:
+        wanted = list(pairs)
+        merged: Dict[Tuple[str, int], DatHashRow] = {}
+        for found in self._fan_out(lambda index: index.lookup_crc_size_when_sha1_missing_many(wanted)):
+            for key, row in found.items():
+                merged.setdefault(key, row)
+        return merged
+
+    def content_signature(self) -> str:
+        return "|".join(index.content_signature() for index in self._indexes)
+
     def lookup_game(self, game_name: str) -> Optional[Tuple[str, int]]:
-        for index in self._indexes:
-            result = index.lookup_game(game_name)
+        for result in self._fan_out(lambda index: index.lookup_game(game_name)):
             if result:
                 return result
         return None
@@ -708,15 +1203,15 @@ class MultiDatIndexSqlite:
         search_limit: int = 500,
     ) -> List[Dict[str, object]]:
         combined: List[Dict[str, object]] = []
-        for index in self._indexes:
-            combined.extend(
-                index.fuzzy_game_matches(
-                    name,
-                    limit=limit,
-                    min_score=min_score,
-                    search_limit=search_limit,
-                )
+        for matches in self._fan_out(
+            lambda index: index.fuzzy_game_matches(
+                name,
+                limit=limit,
+                min_score=min_score,
+                search_limit=search_limit,
             )
+        ):
+            combined.extend(matches)
         combined.sort(key=lambda entry: float(entry.get("score", 0.0)), reverse=True)
         return combined[: max(1, int(limit))]
 
@@ -734,16 +1229,29 @@ def open_dat_index_from_config(
     return MultiDatIndexSqlite(existing)
 
 
+def _resolve_bulk_ingest(dat_cfg: Dict[str, Any]) -> Tuple[bool, Optional[int]]:
+    try:
+        bulk = bool(dat_cfg.get("bulk_ingest", True))
+    except Exception:
+        bulk = True
+    try:
+        workers = int(dat_cfg.get("ingest_workers", 0) or 0) or None
+    except Exception:
+        workers = None
+    return bulk, workers
+
+
 def build_index_from_config(
     config: Optional[object] = None,
     *,
     cancel_event: Optional[CancelEventProtocol] = None,
-) -> Dict[str, int]:
+) -> Dict[str, Any]:
     cfg = _normalize_config(config)
     dat_cfg = cfg.get("dats", {}) or {}
     paths = dat_cfg.get("import_paths") or []
     if isinstance(paths, str):
         paths = [p.strip() for p in paths.split(";") if p.strip()]
+    bulk, workers = _resolve_bulk_ingest(dat_cfg)
 
     shard_paths = _resolve_shard_paths(cfg)
     if len(shard_paths) <= 1:
@@ -751,7 +1259,7 @@ def build_index_from_config(
         lock_path = Path(dat_cfg.get("lock_path") or os.path.join("data", "index", "romsorter_dat_index.lock"))
         acquire_index_lock(lock_path, index.db_path)
         try:
-            result = index.ingest(paths, cancel_event=cancel_event)
+            result = index.ingest(paths, cancel_event=cancel_event, bulk=bulk, workers=workers)
             return result
         finally:
             release_index_lock(lock_path)
@@ -763,23 +1271,44 @@ def build_index_from_config(
         idx = _stable_shard_index(str(path), len(shard_paths))
         shard_inputs[idx].append(str(path))
 
-    aggregated: Dict[str, int] = {"processed": 0, "skipped": 0, "inserted": 0, "removed": 0}
     lock_base = dat_cfg.get("lock_path") or os.path.join("data", "index", "romsorter_dat_index.lock")
-    for idx, shard_path in enumerate(shard_paths):
-        shard_files = shard_inputs[idx]
-        if not shard_files:
-            continue
+
+    def _ingest_shard(idx: int, shard_path: Path, executor: Optional[concurrent.futures.Executor]) -> Dict[str, Any]:
         index = DatIndexSqlite(Path(shard_path))
         lock_path = _resolve_shard_lock_path(lock_base, shard_path, idx)
         acquire_index_lock(lock_path, index.db_path)
         try:
-            result = index.ingest(shard_files, cancel_event=cancel_event)
-            aggregated["processed"] += int(result.get("processed", 0))
-            aggregated["skipped"] += int(result.get("skipped", 0))
-            aggregated["inserted"] += int(result.get("inserted", 0))
-            aggregated["removed"] += int(result.get("removed", 0))
+            return index.ingest(
+                shard_inputs[idx],
+                cancel_event=cancel_event,
+                bulk=bulk,
+                workers=workers,
+                executor=executor,
+            )
         finally:
             release_index_lock(lock_path)
             index.close()
+
+    active = [(idx, shard_path) for idx, shard_path in enumerate(shard_paths) if shard_inputs[idx]]
+    parse_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+    worker_count = max(1, int(workers or os.cpu_count() or 1))
+    if bulk and worker_count > 1 and sum(len(shard_inputs[idx]) for idx, _ in active) > 1:
+        # One parse pool shared by all shard writers.
+        parse_pool = concurrent.futures.ProcessPoolExecutor(max_workers=worker_count)
+
+    aggregated: Dict[str, Any] = {"processed": 0, "skipped": 0, "inserted": 0, "removed": 0}
+    try:
+        # Shards are independent SQLite files: one writer thread per shard.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(active)), thread_name_prefix="dat-ingest") as pool:
+            futures = [pool.submit(_ingest_shard, idx, shard_path, parse_pool) for idx, shard_path in active]
+            for future in futures:
+                result = future.result()
+                aggregated["processed"] += int(result.get("processed", 0))
+                aggregated["skipped"] += int(result.get("skipped", 0))
+                aggregated["inserted"] += int(result.get("inserted", 0))
+                aggregated["removed"] += int(result.get("removed", 0))
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown(wait=True, cancel_futures=True)
     aggregated["shards"] = len(shard_paths)
     return aggregated
@@ -13,10 +13,11 @@ import json
 import logging
 import os
 import re
+import threading
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 
 from ..config import load_config
 from ..config.schema import JSONSCHEMA_AVAILABLE, validate_config_schema
@@ -31,6 +32,10 @@ class PlatformCandidate:
     conflict_groups: Tuple[str, ...]
 
 
+# Resolved once; Path.resolve() costs several syscalls per call.
+_SRC_ROOT = Path(__file__).resolve().parents[1]
+
+
 def _catalog_yaml_path() -> Path:
     override = os.environ.get("ROM_SORTER_PLATFORM_CATALOG", "").strip()
     if override:
@@ -42,15 +47,15 @@ def _catalog_yaml_path() -> Path:
             return Path(cfg_path)
     except Exception:
         pass
-    return Path(__file__).resolve().parents[1] / "platforms" / "platform_catalog.yaml"
+    return _SRC_ROOT / "platforms" / "platform_catalog.yaml"
 
 
 def _catalog_json_path() -> Path:
-    return Path(__file__).resolve().parents[1] / "config" / "platform_catalog.json"
+    return _SRC_ROOT / "config" / "platform_catalog.json"
 
 
 def _catalog_schema_path() -> Path:
-    return Path(__file__).resolve().parents[1] / "platforms" / "platform_catalog.schema.json"
+    return _SRC_ROOT / "platforms" / "platform_catalog.schema.json"
 
 
 def _catalog_cache_key() -> str:
@@ -248,88 +253,177 @@ def _list_value(value: object) -> List[str]:
     return []
 
 
-def evaluate_platform_candidates(path: str, *, container: Optional[str] = None) -> Dict[str, object]:
-    """Return candidate platforms and signals for a file path.
+def _token_trie_pattern(tokens: Iterable[str]) -> str:
+    """Build a prefix-trie regex so sre branches on one character per level."""
+    trie: Dict[str, Any] = {}
+    for token in tokens:
+        node = trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[""] = True
 
-    This is strictly heuristic and intentionally conservative.
-    """
+    def _emit(node: Dict[str, Any]) -> str:
+        alternatives = [re.escape(char) + _emit(child) for char, child in sorted(node.items()) if char]
+        if not alternatives:
+            return ""
+        body = alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+        # Greedy optional: the longest token at a position wins, shorter ones are implied.
+        return f"(?:{body})?" if "" in node else body
 
-    platforms, status, policy = _load_catalog(_catalog_cache_key())
-    if not platforms:
-        return {
-            "candidates": [],
-            "candidate_systems": [],
-            "signals": [],
-            "candidate_details": [],
-            "policy": policy or {},
-            "reason": f"catalog_{status}"
-        }
+    return _emit(trie)
 
-    p = Path(str(path or ""))
-    ext = p.suffix.lower()
-    container_type = (container or ext.lstrip(".")) or "raw"
-    haystack = _text_haystack(str(path))
-
-    candidates: List[PlatformCandidate] = []
-
-    for entry in platforms:
-        platform_id = str(entry.get("platform_id") or "").strip()
-        if not platform_id:
-            continue
-
-        typical_exts = [x.lower() for x in _list_value(entry.get("typical_extensions"))]
-        allowed_containers = [x.lower() for x in _list_value(entry.get("allowed_containers"))]
-        positive_tokens = _list_value(entry.get("positive_tokens"))
-        negative_tokens = _list_value(entry.get("negative_tokens"))
-        minimum_signals = [x.lower() for x in _list_value(entry.get("minimum_signals"))]
-
-        score = 0.0
-        signals: List[str] = []
-        signal_types: List[str] = []
-
-        # Extension evidence
-        if ext and ext in typical_exts:
-            score += 2.0
-            signals.append(f"EXT:{ext}")
-            signal_types.append("extension")
-
-        # Container evidence
-        if allowed_containers and container_type in allowed_containers:
-            score += 1.0
-            signals.append(f"CONTAINER:{container_type}")
-            signal_types.append("container")
-
-        # Token evidence
-        for token in positive_tokens:
-            if _match_token(haystack, token):
-                score += 1.0
-                signals.append(f"TOKEN:{token}")
-                signal_types.append("token")
-
-        # Negative tokens
-        for token in negative_tokens:
-            if _match_token(haystack, token):
-                score -= 2.0
-                signals.append(f"NEG:{token}")
-                signal_types.append("token")
-
-        if minimum_signals:
-            if not all(req in signal_types for req in minimum_signals):
-                continue
 
-        if score <= 0:
-            continue
+@dataclass(frozen=True)
+class _CompiledPlatform:
+    index: int
+    platform_id: str
+    typical_exts: FrozenSet[str]
+    allowed_containers: FrozenSet[str]
+    positive_tokens: Tuple[Tuple[str, str], ...]
+    negative_tokens: Tuple[Tuple[str, str], ...]
+    minimum_signals: Tuple[str, ...]
+    conflict_groups: Tuple[str, ...]
+
+
+class CompiledPlatformCatalog:
+    """Pre-normalized catalog with inverted indexes, built once per catalog key.
+
+    - extension / container -> platform indexes
+    - one token automaton (prefix-trie regex) over all positive/negative tokens
+
+    Only platforms hit by at least one index are scored; the result is
+    identical to scoring every platform.
+    """
 
-        candidates.append(
-            PlatformCandidate(
+    def __init__(self, platforms: List[Dict[str, object]], status: str, policy: Dict[str, Any]) -> None:
+        self.platforms = platforms
+        self.status = status
+        self.policy = policy
+        self._entries: List[_CompiledPlatform] = []
+        self._by_ext: Dict[str, List[int]] = {}
+        self._by_container: Dict[str, List[int]] = {}
+        self._by_token: Dict[str, List[int]] = {}
+
+        for entry in platforms:
+            platform_id = str(entry.get("platform_id") or "").strip()
+            if not platform_id:
+                continue
+            compiled = _CompiledPlatform(
+                index=len(self._entries),
                 platform_id=platform_id,
-                score=score,
-                signals=tuple(signals),
-                signal_types=tuple(signal_types),
+                typical_exts=frozenset(x.lower() for x in _list_value(entry.get("typical_extensions"))),
+                allowed_containers=frozenset(x.lower() for x in _list_value(entry.get("allowed_containers"))),
+                positive_tokens=tuple((t, _norm_token(t)) for t in _list_value(entry.get("positive_tokens"))),
+                negative_tokens=tuple((t, _norm_token(t)) for t in _list_value(entry.get("negative_tokens"))),
+                minimum_signals=tuple(x.lower() for x in _list_value(entry.get("minimum_signals"))),
                 conflict_groups=tuple(_list_value(entry.get("conflict_groups"))),
             )
-        )
+            self._entries.append(compiled)
+            for ext in compiled.typical_exts:
+                self._by_ext.setdefault(ext, []).append(compiled.index)
+            for container_type in compiled.allowed_containers:
+                self._by_container.setdefault(container_type, []).append(compiled.index)
+            for _raw, norm in compiled.positive_tokens:
+                if norm:
+                    self._by_token.setdefault(norm, []).append(compiled.index)
+
+        tokens: Set[str] = set(self._by_token)
+        for compiled in self._entries:
+            tokens.update(norm for _raw, norm in compiled.negative_tokens if norm)
+        # token -> every token contained in it (itself included)
+        self._implied: Dict[str, Tuple[str, ...]] = {
+            token: tuple(other for other in tokens if other in token) for token in tokens
+        }
+        self._token_re = re.compile(f"(?=({_token_trie_pattern(tokens)}))") if tokens else None
+
+    def match_tokens(self, haystack: str) -> Set[str]:
+        """Return every catalog token that is a substring of ``haystack``."""
+        found: Set[str] = set()
+        if self._token_re is None:
+            return found
+        for match in self._token_re.finditer(haystack):
+            longest = match.group(1)
+            if longest and longest not in found:
+                found.update(self._implied[longest])
+        return found
+
+    def evaluate(self, path: str, *, container: Optional[str] = None) -> Dict[str, object]:
+        if not self.platforms:
+            return {
+                "candidates": [],
+                "candidate_systems": [],
+                "signals": [],
+                "candidate_details": [],
+                "policy": self.policy or {},
+                "reason": f"catalog_{self.status}"
+            }
+
+        p = Path(str(path or ""))
+        ext = p.suffix.lower()
+        container_type = (container or ext.lstrip(".")) or "raw"
+        found = self.match_tokens(_text_haystack(str(path)))
+
+        hit: Set[int] = set()
+        if ext:
+            hit.update(self._by_ext.get(ext, ()))
+        hit.update(self._by_container.get(container_type, ()))
+        for token in found:
+            hit.update(self._by_token.get(token, ()))
+
+        candidates: List[PlatformCandidate] = []
+        for idx in sorted(hit):
+            entry = self._entries[idx]
+            score = 0.0
+            signals: List[str] = []
+            signal_types: List[str] = []
+
+            # Extension evidence
+            if ext and ext in entry.typical_exts:
+                score += 2.0
+                signals.append(f"EXT:{ext}")
+                signal_types.append("extension")
+
+            # Container evidence
+            if container_type in entry.allowed_containers:
+                score += 1.0
+                signals.append(f"CONTAINER:{container_type}")
+                signal_types.append("container")
+
+            # Token evidence
+            for token, norm in entry.positive_tokens:
+                if norm in found:
+                    score += 1.0
+                    signals.append(f"TOKEN:{token}")
+                    signal_types.append("token")
+
+            # Negative tokens
+            for token, norm in entry.negative_tokens:
+                if norm in found:
+                    score -= 2.0
+                    signals.append(f"NEG:{token}")
+                    signal_types.append("token")
+
+            if entry.minimum_signals:
+                if not all(req in signal_types for req in entry.minimum_signals):
+                    continue
+
+            if score <= 0:
+                continue
+
+            candidates.append(
+                PlatformCandidate(
+                    platform_id=entry.platform_id,
+                    score=score,
+                    signals=tuple(signals),
+                    signal_types=tuple(signal_types),
+                    conflict_groups=entry.conflict_groups,
+                )
+            )
+
+        return _build_result(candidates, self.policy)
+
 
+def _build_result(candidates: List[PlatformCandidate], policy: Dict[str, Any]) -> Dict[str, object]:
     candidates.sort(key=lambda c: (-c.score, c.platform_id))
 
     top_signals: List[str] = list(candidates[0].signals) if candidates else []
@@ -354,3 +448,46 @@ def evaluate_platform_candidates(path: str, *, container: Optional[str] = None)
         "policy": policy or {},
         "reason": "ok" if candidates else "no_match",
     }
+
+
+_compiled_lock = threading.Lock()
+_compiled_catalogs: Dict[str, CompiledPlatformCatalog] = {}
+
+
+def get_compiled_catalog(cache_key: Optional[str] = None) -> CompiledPlatformCatalog:
+    """Return the compiled catalog for the current catalog files (rebuilt when they change)."""
+    key = cache_key if cache_key is not None else _catalog_cache_key()
+    platforms, status, policy = _load_catalog(key)
+    compiled = _compiled_catalogs.get(key)
+    # Identity check so _load_catalog.cache_clear() also drops the compiled form.
+    if compiled is None or compiled.platforms is not platforms:
+        compiled = CompiledPlatformCatalog(platforms, status, policy)
+        with _compiled_lock:
+            if len(_compiled_catalogs) >= 4:
+                _compiled_catalogs.clear()
+            _compiled_catalogs[key] = compiled
+    return compiled
+
+
+def evaluate_platform_candidates(path: str, *, container: Optional[str] = None) -> Dict[str, object]:
+    """Return candidate platforms and signals for a file path.
+
+    This is strictly heuristic and intentionally conservative.
+    """
+
+    return get_compiled_catalog().evaluate(path, container=container)
+
+
+def evaluate_many(
+    paths: Iterable[str],
+    *,
+    containers: Optional[Sequence[Optional[str]]] = None,
+) -> List[Dict[str, object]]:
+    """Batch variant of :func:`evaluate_platform_candidates` (catalog key resolved once)."""
+
+    catalog = get_compiled_catalog()
+    results: List[Dict[str, object]] = []
+    for idx, path in enumerate(paths):
+        container = containers[idx] if containers is not None else None
+        results.append(catalog.evaluate(path, container=container))
+    return results
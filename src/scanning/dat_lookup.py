@@ -0,0 +1,105 @@
+"""Batched DAT hash lookups for HighPerformanceScanner.
+
+Scanner worker threads call :meth:`DatLookupBatcher.match` right after hashing
+a file. Requests that arrive while a batch is being resolved are grouped, so one
+``lookup_sha1_many`` (plus one ``lookup_crc_size_when_sha1_missing_many`` for
+the misses) answers a whole batch of hashed files. No linger: a lone request is
+resolved immediately, grouping only happens under concurrency.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import threading
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOOKUP_BATCH_SIZE = 64
+
+# (row, detection_source) or None
+DatMatch = Optional[Tuple[Any, str]]
+
+
+def match_dat_hashes(index: Any, sha1: Optional[str], crc32: Optional[str], size: int) -> DatMatch:
+    """Unbatched lookup: SHA1 first, then CRC32+size for DAT rows without SHA1."""
+    if sha1:
+        row = index.lookup_sha1(sha1)
+        if row:
+            return row, "dat:sha1"
+    if crc32:
+        row = index.lookup_crc_size_when_sha1_missing(crc32, size)
+        if row:
+            return row, "dat:crc-size"
+    return None
+
+
+class DatLookupBatcher:
+    """Coalesce concurrent per-file DAT lookups into batched index queries."""
+
+    def __init__(self, index: Any, *, batch_size: int = DEFAULT_LOOKUP_BATCH_SIZE) -> None:
+        self.index = index
+        self.batch_size = max(1, int(batch_size))
+        self.batches = 0
+        self.lookups = 0
+
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[Optional[str], Optional[str], int, concurrent.futures.Future]] = []
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="dat-lookup-batcher", daemon=True)
+        self._flusher.start()
+
+    def submit(self, sha1: Optional[str], crc32: Optional[str], size: int) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._cond:
+            if self._closed:
+                future.set_result(match_dat_hashes(self.index, sha1, crc32, size))
+                return future
+            self._pending.append((sha1, crc32, int(size), future))
+            self._cond.notify()
+        return future
+
+    def match(self, sha1: Optional[str], crc32: Optional[str], size: int) -> DatMatch:
+        return self.submit(sha1, crc32, size).result()
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                batch = self._pending[: self.batch_size]
+                del self._pending[: self.batch_size]
+            self._resolve(batch)
+
+    def _resolve(self, batch: List[Tuple[Optional[str], Optional[str], int, concurrent.futures.Future]]) -> None:
+        try:
+            sha1_hits = self.index.lookup_sha1_many([sha1 for sha1, _crc, _size, _f in batch if sha1])
+            misses = [
+                (crc32.lower(), size)
+                for sha1, crc32, size, _f in batch
+                if crc32 and not (sha1 and sha1.lower() in sha1_hits)
+            ]
+            crc_hits = self.index.lookup_crc_size_when_sha1_missing_many(misses) if misses else {}
+        except Exception as exc:
+            for *_rest, future in batch:
+                future.set_exception(exc)
+            return
+
+        self.batches += 1
+        self.lookups += len(batch)
+        for sha1, crc32, size, future in batch:
+            row = sha1_hits.get(sha1.lower()) if sha1 else None
+            if row:
+                future.set_result((row, "dat:sha1"))
+                continue
+            row = crc_hits.get((crc32.lower(), size)) if crc32 else None
+            future.set_result((row, "dat:crc-size") if row else None)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._flusher.join(timeout=5.0)
@@ -0,0 +1,213 @@
+"""Process-pool checksum backend for HighPerformanceScanner.
+
+Selected via ``scanner.hash_backend: process`` (default: ``thread``).
+
+Scanner worker threads call :meth:`ProcessHashBackend.hash_file`; requests are
+coalesced into small batches of ``(path, chunk_size)`` jobs and shipped to a
+``ProcessPoolExecutor`` so CRC32/MD5/SHA1 run outside the scanner's GIL. Results
+come back as compact ``(crc32:int, md5:bytes|None, sha1:bytes, error)`` tuples
+(MD5 only when the scanner's hash plan asks for it).
+Pause/stop are propagated to the worker processes through shared events.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+import zlib
+from typing import Any, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+HASH_BACKENDS = ("thread", "process")
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_LINGER_SECONDS = 0.005
+
+INTERRUPTED = "interrupted"
+
+HashTuple = Tuple[Optional[int], Optional[bytes], Optional[bytes], Optional[str]]
+
+# Set in each worker process by _init_worker.
+_STOP_EVENT: Any = None
+_RUN_EVENT: Any = None
+
+
+def _init_worker(stop_event: Any, run_event: Any) -> None:
+    global _STOP_EVENT, _RUN_EVENT
+    _STOP_EVENT = stop_event
+    _RUN_EVENT = run_event
+
+
+def _wait_if_paused() -> bool:
+    """Block while paused; return False if a stop was requested."""
+    if _STOP_EVENT is not None and _STOP_EVENT.is_set():
+        return False
+    if _RUN_EVENT is not None:
+        while not _RUN_EVENT.wait(0.1):
+            if _STOP_EVENT is not None and _STOP_EVENT.is_set():
+                return False
+    return True
+
+
+def hash_file_job(path: str, chunk_size: int, with_md5: bool = True) -> HashTuple:
+    """Compute CRC32, SHA1 (and optionally MD5) of one file in a single pass (worker side)."""
+    crc32_value = 0
+    md5_hash = hashlib.md5(usedforsecurity=False) if with_md5 else None
+    sha1_hash = hashlib.sha1(usedforsecurity=False)
+    try:
+        with open(path, "rb") as handle:
+            while chunk := handle.read(chunk_size):
+                if not _wait_if_paused():
+                    return None, None, None, INTERRUPTED
+                crc32_value = zlib.crc32(chunk, crc32_value)
+                if md5_hash is not None:
+                    md5_hash.update(chunk)
+                sha1_hash.update(chunk)
+    except Exception as exc:
+        return None, None, None, f"{type(exc).__name__}: {exc}"
+    md5_digest = md5_hash.digest() if md5_hash is not None else None
+    return crc32_value & 0xFFFFFFFF, md5_digest, sha1_hash.digest(), None
+
+
+def hash_file_batch(paths: Sequence[str], chunk_size: int, with_md5: bool = True) -> List[HashTuple]:
+    """Hash a batch of files; one result tuple per input path, in order."""
+    results: List[HashTuple] = []
+    for path in paths:
+        if _STOP_EVENT is not None and _STOP_EVENT.is_set():
+            results.append((None, None, None, INTERRUPTED))
+            continue
+        results.append(hash_file_job(path, chunk_size, with_md5))
+    return results
+
+
+def format_hash_tuple(result: HashTuple) -> Tuple[str, Optional[str], str]:
+    """Convert a worker tuple into the scanner's (crc32, md5, sha1) hex strings."""
+    crc32_value, md5_digest, sha1_digest, error = result
+    if error == INTERRUPTED:
+        raise InterruptedError("Scan wurde abgebrochen")
+    if error:
+        raise OSError(error)
+    return (
+        f"{int(crc32_value or 0):08x}",
+        md5_digest.hex() if md5_digest is not None else None,
+        (sha1_digest or b"").hex(),
+    )
+
+
+class ProcessHashBackend:
+    """Batched ProcessPoolExecutor front-end shared by the scanner's worker threads."""
+
+    def __init__(
+        self,
+        chunk_size: int,
+        *,
+        workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        linger: float = DEFAULT_LINGER_SECONDS,
+        with_md5: bool = True,
+    ) -> None:
+        self.chunk_size = int(chunk_size)
+        self.with_md5 = bool(with_md5)
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.batch_size = max(1, int(batch_size))
+        self.linger = max(0.0, float(linger))
+
+        ctx = multiprocessing.get_context()
+        self._stop_event = ctx.Event()
+        self._run_event = ctx.Event()
+        self._run_event.set()
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self._stop_event, self._run_event),
+        )
+
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[str, concurrent.futures.Future]] = []
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="hash-batcher", daemon=True)
+        self._flusher.start()
+
+    def submit(self, path: str) -> concurrent.futures.Future:
+        """Queue one file; the returned future resolves to a raw HashTuple."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._cond:
+            if self._closed:
+                future.set_result((None, None, None, INTERRUPTED))
+                return future
+            self._pending.append((path, future))
+            self._cond.notify()
+        return future
+
+    def hash_file(self, path: str) -> Tuple[str, Optional[str], str]:
+        """Blocking helper for scanner threads: return (crc32, md5, sha1) hex strings."""
+        return format_hash_tuple(self.submit(path).result())
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                if len(self._pending) < self.batch_size and not self._closed and self.linger:
+                    self._cond.wait(self.linger)
+                batch = self._pending[: self.batch_size]
+                del self._pending[: self.batch_size]
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[Tuple[str, concurrent.futures.Future]]) -> None:
+        paths = [path for path, _ in batch]
+        try:
+            job = self._executor.submit(hash_file_batch, paths, self.chunk_size, self.with_md5)
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+
+        def _resolve(done: concurrent.futures.Future) -> None:
+            try:
+                results = done.result()
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+                return
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+        job.add_done_callback(_resolve)
+
+    def pause(self) -> None:
+        self._run_event.clear()
+
+    def resume(self) -> None:
+        self._run_event.set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._run_event.set()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._flusher.join(timeout=5.0)
+        try:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        except Exception as exc:
+            logger.debug("Hash process pool shutdown failed: %s", exc)
+
+
+def resolve_hash_backend(config: Any) -> str:
+    """Return the configured ``scanner.hash_backend`` (``thread`` or ``process``)."""
+    try:
+        scanner_cfg = config.get("scanner", {}) or {}
+        value = str(scanner_cfg.get("hash_backend") or "thread").strip().lower()
+    except Exception:
+        value = "thread"
+    return value if value in HASH_BACKENDS else "thread"
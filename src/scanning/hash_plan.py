@@ -0,0 +1,71 @@
+"""Hash-plan resolver: which digests the scanner computes per file.
+
+Digest consumers in this tree:
+- DatIndexSqlite matching: sha1, crc32 (+ size)
+- HashDuplicateFinder: sha1, crc32 fallback
+- Library health / completeness reports: md5 -> sha1 -> crc32 (first present)
+- ROM database export: stores no digests
+
+So ``auto`` computes CRC32 + SHA1 and skips MD5. ``scanner.hash_set`` may be
+``full`` (CRC32 + MD5 + SHA1) or a list of extra digests, e.g. ``["md5"]``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Tuple
+
+ALL_DIGESTS: Tuple[str, ...] = ("crc32", "md5", "sha1")
+REQUIRED_DIGESTS: FrozenSet[str] = frozenset({"crc32", "sha1"})
+
+HASH_CONSUMERS = {
+    "dat_index": frozenset({"sha1", "crc32"}),
+    "duplicates": frozenset({"sha1", "crc32"}),
+    "reports": frozenset({"sha1"}),
+    "db_export": frozenset(),
+}
+
+
+@dataclass(frozen=True)
+class HashPlan:
+    crc32: bool = True
+    md5: bool = False
+    sha1: bool = True
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(name for name in ALL_DIGESTS if getattr(self, name))
+
+    @property
+    def label(self) -> str:
+        return "+".join(self.names)
+
+
+FULL_HASH_PLAN = HashPlan(crc32=True, md5=True, sha1=True)
+
+
+def resolve_hash_plan(config: Any) -> HashPlan:
+    """Resolve ``scanner.hash_set`` (``auto`` | ``full`` | list of extra digests)."""
+    try:
+        scanner_cfg = config.get("scanner", {}) or {}
+        raw = scanner_cfg.get("hash_set", "auto")
+    except Exception:
+        raw = "auto"
+
+    wanted = set(REQUIRED_DIGESTS)
+    for consumer in HASH_CONSUMERS.values():
+        wanted.update(consumer)
+
+    if isinstance(raw, str):
+        mode = raw.strip().lower()
+        if mode == "full":
+            return FULL_HASH_PLAN
+        if mode not in ("", "auto"):
+            raw = [part for part in mode.replace(";", ",").split(",")]
+    if isinstance(raw, (list, tuple, set)):
+        for name in raw:
+            value = str(name or "").strip().lower()
+            if value in ALL_DIGESTS:
+                wanted.add(value)
+
+    return HashPlan(crc32="crc32" in wanted, md5="md5" in wanted, sha1="sha1" in wanted)
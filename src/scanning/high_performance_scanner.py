@@ -6,10 +6,15 @@ Notes:
 - Thread count and chunk size are derived from config (scanner/performance.processing).
 - Progress updates are throttled when batching is enabled.
 - In-memory cache avoids repeated work within a scan session.
+- Optional persistent SQLite cache (scanner.persistent_cache) makes unchanged rescans stat-only.
 - File processing (including hashing) runs inside a ThreadPoolExecutor worker pool.
+- scanner.hash_backend=process moves checksum work into a ProcessPoolExecutor (batched jobs).
+- Discovery is streamed (os.scandir walker thread + bounded queue), so hashing starts immediately.
+- DAT hash lookups of concurrently hashed files are grouped into batched index queries.
 """
 
 import os
+import stat as stat_module
 import time
 import hashlib
 import logging
@@ -22,7 +27,7 @@ import concurrent.futures
 import re
 from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from ..config import Config
 
@@ -33,6 +38,7 @@ logger = logging.getLogger(__name__)
 MAX_WORKERS = os.cpu_count() or 4  # Fallback auf 4 Threads
 DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024  # 4 MB for file chunking
 DEFAULT_CACHE_MAX_SIZE = 10000  # Max entries in LRU cache to prevent memory leak
+DEFAULT_DISCOVERY_QUEUE_SIZE = 4096  # Bounded walker -> worker pool hand-off
 
 # Archive types are handled separately (ROM detection happens on extracted content in future work).
 ARCHIVE_EXTENSIONS = ['.zip', '.7z', '.rar']
@@ -100,6 +106,7 @@ class HighPerformanceScanner:
         # Optional DAT index (lazy). Provides accurate mapping for No-Intro/Redump/TOSEC/MAME style sets.
         self._dat_index = None
         self._dat_lock = threading.Lock()
+        self._dat_lookup = None
 
         # Ignore extensions configured from config
         self._ignore_exts = self._resolve_ignore_extensions()
@@ -113,6 +120,17 @@ class HighPerformanceScanner:
         self._cache_hits = 0
         self._cache_misses = 0
 
+        # Checksum backend ("thread" = inline in the worker threads, "process" = process pool per scan)
+        from .hash_backend import resolve_hash_backend
+        self.hash_backend = resolve_hash_backend(self.config)
+        from .hash_plan import resolve_hash_plan
+        self.hash_plan = resolve_hash_plan(self.config)
+        self._hash_backend = None
+
+        # Optional persistent cache shared across runs (partitioned by scan source)
+        self._scan_source = ""
+        self._persistent_cache = self._resolve_persistent_cache()
+
     def _resolve_max_workers(self) -> int:
         try:
             scanner_cfg = self.config.get("scanner", {}) or {}
@@ -157,6 +175,85 @@ class HighPerformanceScanner:
             pass
         return DEFAULT_CACHE_MAX_SIZE
 
+    def _start_hash_backend(self):
+        """Start the process-pool checksum backend for one scan (None = hash inline)."""
+        if self.hash_backend != "process":
+            return None
+        try:
+            from .hash_backend import ProcessHashBackend
+
+            scanner_cfg = self.config.get("scanner", {}) or {}
+            workers = int(scanner_cfg.get("hash_processes", 0) or 0) or None
+            batch_size = int(scanner_cfg.get("hash_batch_size", 0) or 0) or 16
+            return ProcessHashBackend(
+                self.chunk_size,
+                workers=workers,
+                batch_size=batch_size,
+                with_md5=self.hash_plan.md5,
+            )
+        except Exception as exc:
+            logger.warning(f"Prozess-Hashing nicht verfügbar, nutze Threads: {exc}")
+            return None
+
+    def _start_dat_lookup(self):
+        """Start the batched DAT lookup front-end for one scan (None = direct lookups)."""
+        dat_index = self._get_dat_index()
+        if dat_index is None or not hasattr(dat_index, "lookup_sha1_many"):
+            return None
+        try:
+            from .dat_lookup import DEFAULT_LOOKUP_BATCH_SIZE, DatLookupBatcher
+
+            scanner_cfg = self.config.get("scanner", {}) or {}
+            batch_size = int(scanner_cfg.get("dat_lookup_batch_size", 0) or 0) or DEFAULT_LOOKUP_BATCH_SIZE
+            return DatLookupBatcher(dat_index, batch_size=batch_size)
+        except Exception as exc:
+            logger.debug("Batched DAT lookup unavailable: %s", exc)
+            return None
+
+    def _close_dat_lookup(self) -> None:
+        batcher, self._dat_lookup = self._dat_lookup, None
+        if batcher is not None:
+            batcher.close()
+
+    def _match_dat_hashes(self, dat_index, sha1: Optional[str], crc32: Optional[str], size: int):
+        """Return ``(row, detection_source)`` for a DAT hit, batched while a scan is running."""
+        batcher = self._dat_lookup
+        if batcher is not None and batcher.index is dat_index:
+            return batcher.match(sha1, crc32, size)
+        from .dat_lookup import match_dat_hashes
+
+        return match_dat_hashes(dat_index, sha1, crc32, size)
+
+    def _resolve_persistent_cache(self):
+        """Open the persistent scan cache if ``scanner.persistent_cache.enabled`` is set."""
+        try:
+            scanner_cfg = self.config.get("scanner", {}) or {}
+            cache_cfg = scanner_cfg.get("persistent_cache") or {}
+            if not isinstance(cache_cfg, dict) or not bool(cache_cfg.get("enabled", False)):
+                return None
+            from .scan_cache import DEFAULT_MAX_ENTRIES, PersistentScanCache, resolve_scan_cache_path
+
+            max_entries = int(cache_cfg.get("max_entries") or DEFAULT_MAX_ENTRIES)
+            return PersistentScanCache(resolve_scan_cache_path(self.config), max_entries=max_entries)
+        except Exception as exc:
+            logger.debug("Persistent scan cache unavailable: %s", exc)
+            return None
+
+    def _resolve_cache_context(self) -> str:
+        """Fingerprint of inputs that change results for unchanged files (hash plan, DAT index, catalog)."""
+        parts: List[str] = [self.hash_plan.label]
+        dat_index = self._get_dat_index()
+        try:
+            parts.append(dat_index.content_signature() if dat_index is not None else "no-dat")
+        except Exception:
+            parts.append("dat-unknown")
+        try:
+            from ..core.platform_heuristics import _catalog_cache_key
+            parts.append(_catalog_cache_key())
+        except Exception:
+            parts.append("catalog-unknown")
+        return "|".join(parts)
+
     def _resolve_ignore_extensions(self) -> Set[str]:
         ignore_exts: Set[str] = set()
         try:
@@ -219,6 +316,9 @@ class HighPerformanceScanner:
         self.errors = 0
         self.start_time = 0
         self.end_time = 0
+        self._walk_finished = False
+        self._walk_dirs_queued = 0
+        self._walk_dirs_listed = 0
 
 # Extended tracking for detailed analysis
         self.system_counts = {}  # Counts Roms per system
@@ -262,6 +362,9 @@ class HighPerformanceScanner:
         self.should_stop = False
         self.is_paused = False
         self._reset_counters()
+        self._scan_source = os.path.abspath(directory)
+        if self._persistent_cache is not None and use_cache:
+            self._persistent_cache.context = self._resolve_cache_context()
 
 # Pack Scan options in a dictionary
         scan_options = {
@@ -286,6 +389,8 @@ class HighPerformanceScanner:
         if self.is_running and not self.is_paused:
             logger.info("Scan pausiert")
             self.is_paused = True
+            if self._hash_backend is not None:
+                self._hash_backend.pause()
             return True
         return False
 
@@ -294,6 +399,8 @@ class HighPerformanceScanner:
         if self.is_running and self.is_paused:
             logger.info("Scan fortgesetzt")
             self.is_paused = False
+            if self._hash_backend is not None:
+                self._hash_backend.resume()
             return True
         return False
 
@@ -303,11 +410,20 @@ class HighPerformanceScanner:
             logger.info("Scan wird gestoppt...")
             self.should_stop = True
             self.is_paused = False
+            if self._hash_backend is not None:
+                self._hash_backend.stop()
             return True
         return False
 
     def _scan_thread(self, directory: str, options: Dict[str, Any]):
-        """Main thread for the scanning process. Coordinates the worker threads and collects the results. Args: Directory: The directory to be searched Options: Dictionary with scan options"""
+        """Main thread for the scanning process.
+
+        A walker thread streams candidates into a bounded discovery queue while this
+        thread keeps at most ``max_workers * 4`` files in flight in the worker pool,
+        so hashing starts with the first discovered file and memory does not scale
+        with the size of the library. Progress totals are estimates until the walk
+        has finished. Args: Directory: The directory to be searched Options:
+        Dictionary with scan options"""
         try:
             self.start_time = time.time()
 
@@ -322,20 +438,22 @@ class HighPerformanceScanner:
             logger.info(f"Starte Scan von {directory} mit Optionen: recursive={recursive}, "
                        f"max_depth={max_depth}, follow_symlinks={follow_symlinks}")
 
-# Collect all files to be scanned
-            file_list = self._collect_files(directory, recursive, file_types, max_depth, follow_symlinks)
-            total_files = len(file_list)
-
-# No files found?
-            if total_files == 0:
-                self._finish_scan("Keine Dateien gefunden")
-                return
-
-            logger.info(f"{total_files} zu scannende Dateien gefunden")
-
-# Initialize the thread pool with an optimal number of thread
-            num_workers = min(self.max_workers, max(1, total_files // 10))
-            logger.info(f"Starte Scan mit {num_workers} Worker-Threads")
+# Start streaming discovery (bounded queue, consumed while walking)
+            discovery: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=DEFAULT_DISCOVERY_QUEUE_SIZE)
+            self._walk_finished = False
+            walker = threading.Thread(
+                target=self._walk_into_queue,
+                args=(directory, recursive, file_types, max_depth, follow_symlinks, discovery),
+                daemon=True,
+            )
+            walker.start()
+
+            num_workers = self.max_workers
+            max_in_flight = max(1, num_workers * 4)
+            self._hash_backend = self._start_hash_backend()
+            self._dat_lookup = self._start_dat_lookup()
+            logger.info(f"Starte Scan mit {num_workers} Worker-Threads (Hashing: "
+                        f"{'Prozesse' if self._hash_backend is not None else 'Threads'})")
 
             progress_batch = True
             try:
@@ -345,93 +463,160 @@ class HighPerformanceScanner:
             except Exception:
                 progress_batch = True
 
-            progress_every = max(1, total_files // 100) if progress_batch else 1
             last_progress_ts = 0.0
+            discovery_done = False
+            in_flight: Dict[concurrent.futures.Future, str] = {}
 
 # Use a thread pool for file processing
             with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
-# Starts with the processing of the files
-                futures = {executor.submit(self._process_file, file_path, use_cache): file_path
-                          for file_path in file_list}
-
-# Process the results while you arrive
-                for i, future in enumerate(concurrent.futures.as_completed(futures)):
+                while True:
 # Check whether the scan should be stopped
                     if self.should_stop:
-                        for f in futures:
+                        for f in in_flight:
                             f.cancel()
                         break
 
-# Wait when paused
-                    while self.is_paused and not self.should_stop:
-                        time.sleep(0.1)
+# Top up the pool from the discovery queue
+                    while not discovery_done and len(in_flight) < max_in_flight:
+                        try:
+                            if in_flight:
+                                file_path = discovery.get_nowait()
+                            else:
+                                file_path = discovery.get(timeout=0.1)
+                        except queue.Empty:
+                            break
+                        if file_path is None:
+                            discovery_done = True
+                            break
+                        in_flight[executor.submit(self._process_file, file_path, use_cache)] = file_path
+
+                    if not in_flight:
+                        if discovery_done:
+                            break
+                        continue
 
-# Processes the result
-                    try:
-                        _ = futures[future]
-                        rom_info = future.result() or {}  # Ensure we have a valid dict, not None
+                    done, _ = concurrent.futures.wait(
+                        in_flight, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        file_to_report = in_flight.pop(future)
 
-# If a valid rome was found
-                        if rom_info:
-                            self.roms_found += 1
+# Wait when paused
+                        while self.is_paused and not self.should_stop:
+                            time.sleep(0.1)
 
-# Updates the system statistics
-                            system = rom_info.get('system', 'Unknown')
-                            self.system_counts[system] = self.system_counts.get(system, 0) + 1
+# Processes the result
+                        try:
+                            rom_info = future.result() or {}  # Ensure we have a valid dict, not None
+                            if rom_info:
+                                self._record_rom(rom_info)
+                        except Exception as e:
+                            self.errors += 1
+                            logger.error(f"Fehler bei der Verarbeitung von {file_to_report}: {str(e)}")
+
+# Updates progress (estimated total until the walk has finished)
+                        self.files_processed += 1
+                        if self.on_progress:
+                            total_estimate = self._estimate_total_files()
+                            progress_every = max(1, total_estimate // 100) if progress_batch else 1
+                            is_last = discovery_done and not in_flight
+                            if not progress_batch or self.files_processed % progress_every == 0 or is_last:
+                                now = time.time()
+                                if (now - last_progress_ts) >= 0.05 or is_last:
+                                    last_progress_ts = now
+                                    self.on_progress(self.files_processed, total_estimate)
+
+            walker.join(timeout=1.0)
+            self._close_hash_backend()
+            self._close_dat_lookup()
 
-# Updates the size statistics
-                            size = rom_info.get('size', 0)
-                            if size < 1024 * 1024:  # <1MB
-                                self.size_distribution['small'] += 1
-                            elif size < 50 * 1024 * 1024:  # <50MB
-                                self.size_distribution['medium'] += 1
-                            elif size < 500 * 1024 * 1024:  # <500MB
-                                self.size_distribution['large'] += 1
-                            else:  # >500MB
-                                self.size_distribution['xl'] += 1
+# No files found?
+            if self.files_found == 0 and not self.should_stop:
+                self._finish_scan("Keine Dateien gefunden")
+                return
 
-# Call the callback, if available
-                            if self.on_rom_found:
-                                self.on_rom_found(rom_info)
-
-                    except Exception as e:
-                        self.errors += 1
-                        # Use the file from the future dictionary
-                        file_to_report = futures.get(future, "unknown file")
-                        logger.error(f"Fehler bei der Verarbeitung von {file_to_report}: {str(e)}")
-
-# Updates progress
-                    self.files_processed += 1
-                    if self.on_progress:
-                        if not progress_batch or self.files_processed % progress_every == 0 or self.files_processed == total_files:
-                            now = time.time()
-                            if (now - last_progress_ts) >= 0.05 or self.files_processed == total_files:
-                                last_progress_ts = now
-                                self.on_progress(self.files_processed, total_files)
+            logger.info(f"{self.files_found} Dateien gefunden, {self.files_processed} verarbeitet")
 
 # One last progress update
             if self.on_progress:
-                self.on_progress(self.files_processed, total_files)
+                self.on_progress(self.files_processed, max(self.files_found, self.files_processed))
 
 # Scan completed
             self._finish_scan("Scan erfolgreich abgeschlossen")
 
         except Exception as e:
             logger.exception("Unerwarteter Fehler beim Scannen")
+            self._close_hash_backend()
+            self._close_dat_lookup()
             if self.on_error:
                 self.on_error(str(e))
             self._finish_scan(f"Fehler: {str(e)}")
 
-    def _collect_files(self, directory: str, recursive: bool, file_types: Optional[List[str]],
-                      max_depth: int = -1, follow_symlinks: bool = False, current_depth: int = 0) -> List[str]:
-        """Collect all files to be scanned in the specified directory. Args: Directory: Directory to be searched Recursive: Whether subdirectaries should be searched File_types: List of file extensions or None for all known types Max_depth: Maximum depth of recursion (-1 for unlimited) Follow_symlinks: Whether symbolic links should be followed Current_deth: Current recursion depths (used internally) Return: List of all found file paths"""
-        result = []
+    def _close_hash_backend(self) -> None:
+        backend, self._hash_backend = self._hash_backend, None
+        if backend is not None:
+            backend.close()
 
-# Reached maximum depth?
-        if max_depth >= 0 and current_depth > max_depth:
-            return result
+    def _record_rom(self, rom_info: Dict[str, Any]) -> None:
+        """Update statistics for a found ROM and invoke the on_rom_found callback."""
+        self.roms_found += 1
+
+# Updates the system statistics
+        system = rom_info.get('system', 'Unknown')
+        self.system_counts[system] = self.system_counts.get(system, 0) + 1
+
+# Updates the size statistics
+        size = rom_info.get('size', 0)
+        if size < 1024 * 1024:  # <1MB
+            self.size_distribution['small'] += 1
+        elif size < 50 * 1024 * 1024:  # <50MB
+            self.size_distribution['medium'] += 1
+        elif size < 500 * 1024 * 1024:  # <500MB
+            self.size_distribution['large'] += 1
+        else:  # >500MB
+            self.size_distribution['xl'] += 1
+
+# Call the callback, if available
+        if self.on_rom_found:
+            self.on_rom_found(rom_info)
+
+    def _walk_into_queue(self, directory: str, recursive: bool, file_types: Optional[List[str]],
+                         max_depth: int, follow_symlinks: bool,
+                         discovery: "queue.Queue[Optional[str]]") -> None:
+        """Walker thread: feed discovered files into the bounded queue, then a None sentinel."""
+        try:
+            for file_path in self._iter_files(directory, recursive, file_types, max_depth, follow_symlinks):
+                while not self.should_stop:
+                    try:
+                        discovery.put(file_path, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if self.should_stop:
+                    break
+        except Exception as e:
+            logger.error(f"Fehler beim Durchsuchen von {directory}: {str(e)}")
+        finally:
+            self._walk_finished = True
+            while True:
+                try:
+                    discovery.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    if self.should_stop:
+                        break
 
-# Determine the file extensions to be searched
+    def _estimate_total_files(self) -> int:
+        """Estimate the final file count from the walk so far; exact once the walk is done."""
+        found = self.files_found
+        if self._walk_finished:
+            return found
+        listed = max(1, self._walk_dirs_listed)
+        pending = max(0, self._walk_dirs_queued - self._walk_dirs_listed)
+        return max(found, self.files_processed) + int(found / listed * pending)
+
+    def _resolve_file_type_set(self, file_types: Optional[List[str]]) -> Set[str]:
+        """Normalize the requested extensions (None = all known ROM types + archives + set files)."""
         if file_types is None:
             # Pull the complete ROM extension set from the central console database.
             # This avoids hardcoded/partial mappings (e.g. '.bin' -> Sega for everything).
@@ -442,23 +627,70 @@ class HighPerformanceScanner:
             # Ensure primary set files are included
             file_types.extend([".cue", ".gdi", ".m3u"])
 
-        try:
-            # Normalize the file extensions (ensure leading dot)
-            normalized: List[str] = []
-            for ext in (file_types or []):
-                if not ext:
-                    continue
-                ext = ext.lower()
-                if not ext.startswith('.'):
-                    ext = f'.{ext}'
-                normalized.append(ext)
-            file_types = normalized
+        normalized: Set[str] = set()
+        for ext in (file_types or []):
+            if not ext:
+                continue
+            ext = ext.lower()
+            if not ext.startswith('.'):
+                ext = f'.{ext}'
+            normalized.add(ext)
+        return normalized
 
-            file_type_set = set(file_types)
+    def _collect_files(self, directory: str, recursive: bool, file_types: Optional[List[str]],
+                      max_depth: int = -1, follow_symlinks: bool = False) -> List[str]:
+        """Collect all files to be scanned in the specified directory (eager wrapper around _iter_files)."""
+        return list(self._iter_files(directory, recursive, file_types, max_depth, follow_symlinks))
+
+    def _iter_files(self, directory: str, recursive: bool, file_types: Optional[List[str]],
+                    max_depth: int = -1, follow_symlinks: bool = False) -> Iterator[str]:
+        """Lazily yield all files to be scanned below ``directory`` (depth-first, os.scandir).
+
+        Directory entries are classified from ``DirEntry`` type data, so no extra
+        stat calls are needed per entry. Args: Directory: Directory to be searched
+        Recursive: Whether subdirectories should be searched File_types: List of file
+        extensions or None for all known types Max_depth: Maximum depth of recursion
+        (-1 for unlimited) Follow_symlinks: Whether symbolic links should be followed"""
+        file_type_set = self._resolve_file_type_set(file_types)
+
+        self._walk_dirs_queued = 1
+        self._walk_dirs_listed = 0
+        stack: List[Tuple[str, int]] = [(str(directory), 0)]
+        while stack:
+            if self.should_stop:
+                return
+            current, depth = stack.pop()
 
-            # Used Pathlib for better platform independence
+# Reached maximum depth?
+            if max_depth >= 0 and depth > max_depth:
+                continue
+
+            files, subdirs = self._list_directory(current, recursive, file_type_set, follow_symlinks)
+            self._walk_dirs_listed += 1
+            yield from files
+
+            if subdirs and (max_depth < 0 or depth + 1 <= max_depth):
+                # Reverse so subdirectories are visited in listing order
+                stack.extend((sub, depth + 1) for sub in reversed(subdirs))
+                self._walk_dirs_queued += len(subdirs)
+
+    def _list_directory(self, directory: str, recursive: bool, file_type_set: Set[str],
+                        follow_symlinks: bool) -> Tuple[List[str], List[str]]:
+        """List one directory: return (scan candidates, subdirectories to descend into)."""
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
             dir_path = Path(directory)
 
+            # PS3 extracted game folder: treat as single ROM and skip its contents
+            if self._is_ps3_game_dir(dir_path):
+                files.append(str(dir_path))
+                self.files_found += 1
+                return files, subdirs
+
+            with os.scandir(directory) as it:
+                entries = list(it)
+
             known_sets = {}
             is_set_member_file = None
             try:
@@ -467,53 +699,40 @@ class HighPerformanceScanner:
             except Exception:
                 known_sets = {}
 
-            # PS3 extracted game folder: treat as single ROM and skip its contents
-            if self._is_ps3_game_dir(dir_path):
-                result.append(str(dir_path))
-                self.files_found += 1
-                return result
-
 # Browse all entries in the directory
-            for entry in dir_path.iterdir():
+            for entry in entries:
 # Check whether the scan should be stopped
                 if self.should_stop:
                     break
 
 # Symlink policy: skip symlinked files always; follow symlinked dirs only if enabled
                 if entry.is_symlink():
-                    if entry.is_dir() and follow_symlinks:
-                        pass
-                    else:
+                    if not (follow_symlinks and entry.is_dir()):
                         continue
 
                 # Subdir?
                 if entry.is_dir():
-                    if self._is_ps3_game_dir(entry):
-                        result.append(str(entry))
+                    if self._is_ps3_game_dir(Path(entry.path)):
+                        files.append(entry.path)
                         self.files_found += 1
                         continue
                     if recursive:
-                        # Recursive call for subdirectory
-                        subdir_files = self._collect_files(
-                            str(entry), recursive, file_types,
-                            max_depth, follow_symlinks, current_depth + 1
-                        )
-                        result.extend(subdir_files)
+                        subdirs.append(entry.path)
 
 # File?
                 elif entry.is_file():
                     # Check whether the file extension is in the list
-                    ext = entry.suffix.lower()
+                    ext = os.path.splitext(entry.name)[1].lower()
                     if ext in self._ignore_exts:
                         continue
                     if known_sets and is_set_member_file is not None:
                         try:
-                            if is_set_member_file(entry, known_sets):
+                            if is_set_member_file(Path(entry.path), known_sets):
                                 continue
                         except Exception:
                             pass
-                    if ext in file_type_set or (known_sets and str(entry) in known_sets):
-                        result.append(str(entry))
+                    if ext in file_type_set or (known_sets and entry.path in known_sets):
+                        files.append(entry.path)
                         self.files_found += 1
 
 # Updates the expansion statistics
@@ -521,14 +740,14 @@ class HighPerformanceScanner:
 
 # Callback, if available
                         if self.on_file_found:
-                            self.on_file_found(str(entry))
+                            self.on_file_found(entry.path)
 
         except Exception as e:
             logger.error(f"Fehler beim Sammeln der Dateien in {directory}: {str(e)}")
             if self.on_error:
                 self.on_error(f"Fehler beim Sammeln der Dateien: {str(e)}")
 
-        return result
+        return files, subdirs
 
     def _process_file(self, file_path: str, use_cache: bool = True) -> Optional[Dict]:
         """Process a single file and return the rom information if found. ARGS: File_Path: Path to the File to Be Processed Use_cache: Whether Cache Data Should be used Return: Dictionary with Rome Information or None If No Rome Has Be."""
@@ -539,18 +758,20 @@ class HighPerformanceScanner:
             path_obj = Path(file_path)
 
             file_stat = None
-            cache_key = None
-            if use_cache and path_obj.is_file():
+            if use_cache:
                 try:
+                    # Single stat: validates both cache layers and is reused below.
                     file_stat = os.stat(file_path)
-                    cache_key = self._make_cache_key(file_path, file_stat)
-                    with self._cache_lock:
-                        cached = self._cache.get(cache_key)
-                    if cached:
-                        return cached
+                    if stat_module.S_ISREG(file_stat.st_mode):
+                        cached = self._get_from_cache(file_path, file_stat)
+                        if cached:
+                            return cached
+                        cached = self._get_from_persistent_cache(file_path, file_stat)
+                        if cached:
+                            self._save_to_cache(file_path, cached, file_stat=file_stat)
+                            return cached
                 except Exception:
                     file_stat = None
-                    cache_key = None
 
             if path_obj.is_dir() and self._is_ps3_game_dir(path_obj):
                 file_stat = file_stat or os.stat(file_path)
@@ -569,7 +790,7 @@ class HighPerformanceScanner:
                     'is_directory': True,
                 }
                 if use_cache:
-                    self._save_to_cache(file_path, rom_info, file_stat=file_stat)
+                    self._store_result(file_path, rom_info, file_stat)
                 return rom_info
 
 # Perform cache lookup if activated
@@ -652,7 +873,7 @@ class HighPerformanceScanner:
                             'valid': True,
                         }
                         if use_cache:
-                            self._save_to_cache(file_path, rom_info, file_stat=file_stat)
+                            self._store_result(file_path, rom_info, file_stat)
                         return rom_info
 
             # Calculates checksums (used for DAT matching too)
@@ -668,21 +889,13 @@ class HighPerformanceScanner:
             canonical_name: Optional[str] = None
             if dat_index is not None:
                 try:
-                    match = dat_index.lookup_sha1(sha1)
-                    if match:
+                    dat_match = self._match_dat_hashes(dat_index, sha1, crc32, file_size)
+                    if dat_match:
+                        match, detection_source = dat_match
                         rom_system = match.platform_id or "Unknown"
                         confidence = 1000.0
-                        detection_source = "dat:sha1"
                         is_exact = True
                         canonical_name = match.rom_name or match.set_name
-                    else:
-                        match_crc = dat_index.lookup_crc_size_when_sha1_missing(crc32, file_size)
-                        if match_crc:
-                            rom_system = match_crc.platform_id or "Unknown"
-                            confidence = 1000.0
-                            detection_source = "dat:crc-size"
-                            is_exact = True
-                            canonical_name = match_crc.rom_name or match_crc.set_name
                 except Exception:
                     pass
 
@@ -828,7 +1041,7 @@ class HighPerformanceScanner:
 
 # Saves the information in the cache
             if use_cache:
-                self._save_to_cache(file_path, rom_info, file_stat=file_stat)
+                self._store_result(file_path, rom_info, file_stat)
 
             return rom_info
 
@@ -1555,10 +1768,14 @@ class HighPerformanceScanner:
 
         return None
 
-    def _calculate_checksums(self, file_path: str) -> Tuple[str, str, str]:
-        """Calculate CRC32, MD5 and SHA1 of a file in a single pass."""
+    def _calculate_checksums(self, file_path: str) -> Tuple[str, Optional[str], str]:
+        """Calculate CRC32, SHA1 and (if the hash plan needs it) MD5 of a file in a single pass."""
+        backend = self._hash_backend
+        if backend is not None:
+            return backend.hash_file(file_path)
+
         crc32_value = 0
-        md5_hash = hashlib.md5(usedforsecurity=False)
+        md5_hash = hashlib.md5(usedforsecurity=False) if self.hash_plan.md5 else None
         sha1_hash = hashlib.sha1(usedforsecurity=False)
 
         with open(file_path, 'rb') as f:
@@ -1573,10 +1790,12 @@ class HighPerformanceScanner:
 
                 # Updates all checksums at the same time for efficiency
                 crc32_value = zlib.crc32(chunk, crc32_value)
-                md5_hash.update(chunk)
+                if md5_hash is not None:
+                    md5_hash.update(chunk)
                 sha1_hash.update(chunk)
 
-        return f"{crc32_value & 0xFFFFFFFF:08x}", md5_hash.hexdigest(), sha1_hash.hexdigest()
+        md5_hex = md5_hash.hexdigest() if md5_hash is not None else None
+        return f"{crc32_value & 0xFFFFFFFF:08x}", md5_hex, sha1_hash.hexdigest()
 
     _StatLike = Any
 
@@ -1603,6 +1822,26 @@ class HighPerformanceScanner:
             self._cache_misses += 1
             return None
 
+    def _get_from_persistent_cache(self, file_path: str, file_stat: _StatLike) -> Optional[Dict]:
+        """Look up ROM information in the persistent cache (size/mtime_ns/inode validated)."""
+        if self._persistent_cache is None:
+            return None
+        try:
+            return self._persistent_cache.get(self._scan_source, file_path, file_stat)
+        except Exception as exc:
+            logger.debug("Persistent scan cache lookup failed for %s: %s", file_path, exc)
+            return None
+
+    def _store_result(self, file_path: str, rom_info: Dict, file_stat: Optional[_StatLike]) -> None:
+        """Store a freshly computed result in the LRU cache and the persistent cache."""
+        self._save_to_cache(file_path, rom_info, file_stat=file_stat)
+        if self._persistent_cache is None:
+            return
+        try:
+            self._persistent_cache.put(self._scan_source, file_path, file_stat or os.stat(file_path), rom_info)
+        except Exception as exc:
+            logger.debug("Persistent scan cache write failed for %s: %s", file_path, exc)
+
     def _save_to_cache(self, file_path: str, rom_info: Dict, file_stat: Optional[_StatLike] = None) -> None:
         """Store ROM information in the LRU cache with size limit.
         
@@ -1637,7 +1876,14 @@ class HighPerformanceScanner:
         
         Returns:
             Dict with cache size, max size, hits, misses, and hit ratio.
+            ``persistent`` holds the same counters for the on-disk cache (None if disabled).
         """
+        persistent = None
+        if self._persistent_cache is not None:
+            try:
+                persistent = self._persistent_cache.stats()
+            except Exception:
+                persistent = None
         with self._cache_lock:
             total = self._cache_hits + self._cache_misses
             hit_ratio = self._cache_hits / total if total > 0 else 0.0
@@ -1647,6 +1893,7 @@ class HighPerformanceScanner:
                 "hits": self._cache_hits,
                 "misses": self._cache_misses,
                 "hit_ratio": hit_ratio,
+                "persistent": persistent,
             }
 
     def clear_cache(self) -> None:
@@ -1661,6 +1908,12 @@ class HighPerformanceScanner:
         self.end_time = time.time()
         duration = self.end_time - self.start_time
 
+        if self._persistent_cache is not None:
+            try:
+                self._persistent_cache.flush()
+            except Exception as exc:
+                logger.warning(f"Scan-Cache konnte nicht gespeichert werden: {exc}")
+
         logger.info(f"Scan abgeschlossen: {message}")
         logger.info(f"Gefundene Dateien: {self.files_found}")
         logger.info(f"Gefundene ROMs: {self.roms_found}")
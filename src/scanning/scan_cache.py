@@ -0,0 +1,271 @@
+"""Persistent scan-result cache (SQLite) for HighPerformanceScanner.
+
+Entries are partitioned by scan source and validated against size,
+``st_mtime_ns`` and inode, so an unchanged file resolves with a single
+``stat()`` on rescan instead of being hashed again.
+
+Notes:
+- A context fingerprint (DAT index + platform catalog signature) is stored per
+  entry; results produced against a different DAT/catalog state are misses.
+- Writes and LRU touches are buffered and flushed in batches.
+- Size is bounded by ``max_entries``; least recently used rows are evicted.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+DEFAULT_MAX_ENTRIES = 500000
+DEFAULT_FLUSH_BATCH = 256
+
+_StatLike = Any
+
+
+def stat_signature(file_stat: _StatLike) -> Tuple[int, int, int]:
+    """Return (size, mtime_ns, inode) for a stat result."""
+    size = int(getattr(file_stat, "st_size", 0) or 0)
+    mtime_ns = getattr(file_stat, "st_mtime_ns", None)
+    if mtime_ns is None:
+        mtime_ns = int(float(getattr(file_stat, "st_mtime", 0.0) or 0.0) * 1_000_000_000)
+    inode = int(getattr(file_stat, "st_ino", 0) or 0)
+    return size, int(mtime_ns), inode
+
+
+class PersistentScanCache:
+    """Durable (source, path) -> rom_info store with stat validation and LRU eviction."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        flush_batch: int = DEFAULT_FLUSH_BATCH,
+        context: str = "",
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, int(max_entries))
+        self.flush_batch = max(1, int(flush_batch))
+        self.context = str(context or "")
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._apply_pragmas()
+        self._init_schema()
+
+        self._pending_writes: Dict[Tuple[str, str], Tuple[int, int, int, str]] = {}
+        self._pending_touches: Dict[Tuple[str, str], int] = {}
+        self._writes_since_trim = 0
+        self._trim_interval = max(1000, self.max_entries // 10)
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._evicted = 0
+
+        cur = self.conn.cursor()
+        cur.execute("SELECT COALESCE(MAX(last_used), 0) FROM scan_results")
+        self._clock = int(cur.fetchone()[0] or 0)
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        except Exception as exc:
+            logger.debug("Scan cache flush on close failed: %s", exc)
+        try:
+            self.conn.close()
+        except Exception:
+            return
+
+    def _apply_pragmas(self) -> None:
+        cur = self.conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA cache_size=-20000")
+        cur.execute("PRAGMA busy_timeout=3000")
+        self.conn.commit()
+
+    def _init_schema(self) -> None:
+        cur = self.conn.cursor()
+        cur.execute("PRAGMA user_version")
+        version = int(cur.fetchone()[0] or 0)
+        if version not in (0, SCHEMA_VERSION):
+            # Cache contents are disposable: rebuild instead of migrating.
+            cur.execute("DROP TABLE IF EXISTS scan_results")
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scan_results (
+                source TEXT NOT NULL,
+                path TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                context TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                last_used INTEGER NOT NULL,
+                PRIMARY KEY (source, path)
+            )
+            """
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_scan_results_last_used ON scan_results(last_used)")
+        cur.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def get(self, source: str, path: str, file_stat: _StatLike) -> Optional[Dict[str, Any]]:
+        """Return cached rom_info if size, mtime_ns, inode and context still match."""
+        key = (str(source), str(path))
+        size, mtime_ns, inode = stat_signature(file_stat)
+        with self._lock:
+            pending = self._pending_writes.get(key)
+            if pending is not None:
+                row: Optional[Tuple[Any, ...]] = (*pending[:3], self.context, pending[3])
+            else:
+                cur = self.conn.cursor()
+                cur.execute(
+                    "SELECT size_bytes, mtime_ns, inode, context, payload FROM scan_results WHERE source=? AND path=?",
+                    key,
+                )
+                row = cur.fetchone()
+            if not row:
+                self._misses += 1
+                return None
+            if (int(row[0]), int(row[1]), int(row[2])) != (size, mtime_ns, inode) or row[3] != self.context:
+                self._misses += 1
+                self._stale += 1
+                return None
+            try:
+                payload = json.loads(row[4])
+            except Exception:
+                self._misses += 1
+                return None
+            if not isinstance(payload, dict):
+                self._misses += 1
+                return None
+            self._hits += 1
+            if pending is None:
+                self._pending_touches[key] = self._tick()
+                if len(self._pending_touches) >= self.flush_batch:
+                    self._flush_locked()
+            return payload
+
+    def put(self, source: str, path: str, file_stat: _StatLike, rom_info: Dict[str, Any]) -> None:
+        """Buffer a rom_info entry for the given stat signature."""
+        try:
+            payload = json.dumps(rom_info, default=str)
+        except Exception:
+            return
+        key = (str(source), str(path))
+        size, mtime_ns, inode = stat_signature(file_stat)
+        with self._lock:
+            self._pending_writes[key] = (size, mtime_ns, inode, payload)
+            self._pending_touches.pop(key, None)
+            if len(self._pending_writes) >= self.flush_batch:
+                self._flush_locked()
+
+    def flush(self, *, trim: bool = True) -> None:
+        """Write buffered entries and touches; optionally enforce ``max_entries``."""
+        with self._lock:
+            self._flush_locked()
+            if trim:
+                self._trim_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending_writes and not self._pending_touches:
+            return
+        cur = self.conn.cursor()
+        if self._pending_writes:
+            rows: List[Tuple[Any, ...]] = [
+                (source, path, size, mtime_ns, inode, self.context, payload, self._tick())
+                for (source, path), (size, mtime_ns, inode, payload) in self._pending_writes.items()
+            ]
+            cur.executemany(
+                "INSERT OR REPLACE INTO scan_results "
+                "(source, path, size_bytes, mtime_ns, inode, context, payload, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._writes_since_trim += len(rows)
+        if self._pending_touches:
+            cur.executemany(
+                "UPDATE scan_results SET last_used=? WHERE source=? AND path=?",
+                [(tick, source, path) for (source, path), tick in self._pending_touches.items()],
+            )
+        self.conn.commit()
+        self._pending_writes.clear()
+        self._pending_touches.clear()
+        if self._writes_since_trim >= self._trim_interval:
+            self._trim_locked()
+
+    def _trim_locked(self) -> None:
+        cur = self.conn.cursor()
+        cur.execute("SELECT COUNT(*) FROM scan_results")
+        count = int(cur.fetchone()[0] or 0)
+        self._writes_since_trim = 0
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        cur.execute(
+            "DELETE FROM scan_results WHERE rowid IN "
+            "(SELECT rowid FROM scan_results ORDER BY last_used ASC LIMIT ?)",
+            (excess,),
+        )
+        self.conn.commit()
+        self._evicted += excess
+
+    def clear(self, source: Optional[str] = None) -> None:
+        """Drop all entries (or only those of one source partition)."""
+        with self._lock:
+            self._pending_writes.clear()
+            self._pending_touches.clear()
+            cur = self.conn.cursor()
+            if source is None:
+                cur.execute("DELETE FROM scan_results")
+            else:
+                cur.execute("DELETE FROM scan_results WHERE source=?", (str(source),))
+            self.conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("SELECT COUNT(*) FROM scan_results")
+            size = int(cur.fetchone()[0] or 0) + len(self._pending_writes)
+            total = self._hits + self._misses
+            return {
+                "path": str(self.db_path),
+                "size": size,
+                "max_size": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale": self._stale,
+                "evicted": self._evicted,
+                "hit_ratio": self._hits / total if total > 0 else 0.0,
+            }
+
+
+def resolve_scan_cache_path(config: Any) -> Path:
+    """Resolve the scan cache DB path from ``scanner.persistent_cache.path``."""
+    try:
+        scanner_cfg = config.get("scanner", {}) or {}
+        cache_cfg = scanner_cfg.get("persistent_cache") or {}
+        raw = cache_cfg.get("path") if isinstance(cache_cfg, dict) else None
+    except Exception:
+        raw = None
+    if raw:
+        return Path(str(raw))
+    try:
+        cache_dir = str(config.get("cache_directory", "cache") or "cache")
+    except Exception:
+        cache_dir = "cache"
+    return Path(os.path.join(cache_dir, "scan_cache.sqlite"))